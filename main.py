@@ -221,11 +221,14 @@ if __name__ == "__main__":
                 if user_input_audio.silence_timeout:
                     logger.info("No speech detected for 3 seconds. Exiting...")
                     audio_service.play_sound("standby")
+                    audio_service.close()
                     sys.exit()
 
                 user_input_text = audio_service.transcribe_audio(
                     user_input_audio, user_language
                 )
+                # The recording is a view into the service's capture buffer; hand it back
+                user_input_audio.release()
                 print(
                     Fore.YELLOW
                     + Style.BRIGHT
@@ -1,5 +1,7 @@
 import concurrent.futures
+import io
 import itertools
+import json
 import os
 import queue
 import re
@@ -23,6 +25,13 @@ load_dotenv()
 platform = os.getenv("PLATFORM")
 access_key = os.getenv("PORCUPINE_ACCESS_KEY")
 
+# TTS output buffering; raise these if playback underruns on slow hardware
+tts_blocksize = int(os.getenv("TTS_BLOCKSIZE", "512"))
+tts_latency = os.getenv("TTS_LATENCY", "low")
+if tts_latency not in ("low", "high"):
+    tts_latency = float(tts_latency)  # latency in seconds
+tts_write_batch_samples = 4800  # Upper bound for one coalesced output write (200 ms)
+
 # Initialize OpenAI client
 openai_api_key = os.getenv("OPENAI_API_KEY")
 client = OpenAI(api_key=openai_api_key)
@@ -37,7 +46,6 @@ vad.set_mode(3)  # 0 = aggressive, 3 = least aggressive
 
 # Recording parameters
 sample_rate = 16000  # Standard sample rate for Whisper
-output_file = "output.wav"
 frame_duration_ms = 30  # Frame size in ms (must be 10, 20, or 30)
 frame_size = int(sample_rate * frame_duration_ms / 1000)
 
@@ -54,8 +62,19 @@ model_path = os.path.join(
 
 stop_flag = threading.Event()  # Flag to stop processes when wake-word is detected
 
+# Porcupine frames delivered per wake-word callback (processed row by row)
+wakeword_frames_per_block = 4
+
+# Sentence-ending punctuation used to split the GPT stream for TTS
+sentence_end_pattern = re.compile(r"[.!?]")
+
+# Decoded prompt sounds keyed by file path, filled by load_sound()
+sound_cache = {}
+
 # Rotating spinner for visual feedback
 spinner = itertools.cycle(["-", "\\", "|", "/"])
+spinner_interval = 0.25  # Seconds between spinner updates
+show_spinner = sys.stdout.isatty()  # Only animate on an interactive terminal
 
 
 def execute_command(command):
@@ -88,16 +107,21 @@ def record_audio(sample_rate):
     stream.start()
 
     start_time = time.time()
+    last_spin = 0.0
 
     try:
         while True:
             audio_frame, _ = stream.read(frame_size)
             audio_frames.append(audio_frame)
 
-            # Display a rotating spinner
-            sys.stdout.write(next(spinner))  # Show the next spinner character
-            sys.stdout.flush()
-            sys.stdout.write("\b")  # Erase the last character printed
+            # Display a rotating spinner (about 4 updates per second is enough)
+            if show_spinner:
+                now = time.monotonic()
+                if now - last_spin > spinner_interval:
+                    last_spin = now
+                    # Show the next spinner character and move back over it
+                    sys.stdout.write(next(spinner) + "\b")
+                    sys.stdout.flush()
 
             # Check if speech is detected
             if is_speech(audio_frame, sample_rate):
@@ -139,24 +163,18 @@ def record_audio(sample_rate):
         return None  # Rückgabe None, wenn kein Audio aufgenommen wurde
 
 
-def save_audio_to_wav(audio, sample_rate, filename=output_file):
-    """Save the recorded audio to a WAV file."""
-    wav.write(filename, sample_rate, audio)
-
-
-def transcribe_audio(audio_file_path):
-    """Transcribe the audio file using OpenAI's Whisper API."""
-    with open(audio_file_path, "rb") as audio_file:
-        print("Sending audio to OpenAI for transcription...")
-        transcription = client.audio.transcriptions.create(
-            model="whisper-1", file=audio_file
-        )
-        return transcription.text
+def transcribe_audio(audio, sample_rate):
+    """Transcribe the recorded audio using OpenAI's Whisper API, without touching the disk."""
+    audio_file = io.BytesIO()
+    wav.write(audio_file, sample_rate, audio)
+    audio_file.seek(0)
+    audio_file.name = "audio.wav"  # The SDK derives the upload's file type from the name
 
-
-def delete_wav_file(filename):
-    if os.path.exists(filename):
-        os.remove(filename)
+    print("Sending audio to OpenAI for transcription...")
+    transcription = client.audio.transcriptions.create(
+        model="whisper-1", file=audio_file
+    )
+    return transcription.text
 
 
 def process_speech(client, text, chunk_size=1024):
@@ -184,8 +202,8 @@ def play_audio(samplerate=24000, channels=1):
         samplerate=samplerate,
         channels=channels,
         dtype="int16",
-        blocksize=4096,
-        latency=0.5,
+        blocksize=tts_blocksize,
+        latency=tts_latency,
     )
     stream_audio.start()
 
@@ -202,13 +220,30 @@ def play_audio(samplerate=24000, channels=1):
             stop_flag.set()
             break
 
-        stream_audio.write(audio_data)
+        # Coalesce chunks that are already waiting into a single write
+        pending = [audio_data]
+        pending_samples = audio_data.size
+        end_of_stream = False
+        while pending_samples < tts_write_batch_samples:
+            try:
+                audio_data = audio_queue.get_nowait()
+            except queue.Empty:
+                break
+            if audio_data is None:
+                end_of_stream = True
+                break
+            pending.append(audio_data)
+            pending_samples += audio_data.size
+
+        stream_audio.write(pending[0] if len(pending) == 1 else np.concatenate(pending))
+
+        if end_of_stream:
+            stop_flag.set()
+            break
 
-    # Stoppe und schließe den Audio-Stream
+    # Stoppe und schließe den Audio-Stream (stop() lässt gepufferte Samples noch ausspielen)
     stream_audio.stop()
     stream_audio.close()
-    sd.wait()
-    sd.wait()
 
     # Leere die Audio-Queue, um sicherzustellen, dass keine weiteren Chunks abgespielt werden
     with audio_queue.mutex:
@@ -217,7 +252,7 @@ def play_audio(samplerate=24000, channels=1):
 
 def collect_until_sentence_end(text_buffer):
     """Collect text until a sentence end is detected (., !, ?)."""
-    match = re.search(r"[.!?]", text_buffer)  # Look for sentence-ending punctuation
+    match = sentence_end_pattern.search(text_buffer)  # Look for sentence-ending punctuation
     if match:
         return (
             text_buffer[: match.end()],
@@ -233,30 +268,36 @@ def format_and_print_content(content):
     sys.stdout.flush()
 
 
+def load_sound(file_path):
+    """Decode a WAV file once and keep its samples in memory."""
+    if file_path not in sound_cache:
+        if not os.path.isfile(file_path):
+            print(f"File {file_path} not found!")
+            return None
+        sound_cache[file_path] = wav.read(file_path)  # (sample rate, samples)
+    return sound_cache[file_path]
+
+
 def play_sound(file_path):
-    if not os.path.isfile(file_path):
-        print(f"File {file_path} not found!")
+    sound = load_sound(file_path)
+    if sound is None:
         return
     try:
-        subprocess.run(
-            ["ffplay", "-nodisp", "-autoexit", file_path],
-            stdout=subprocess.DEVNULL,  # Verbirgt Standardausgabe
-            stderr=subprocess.DEVNULL,  # Verbirgt Fehlerausgabe
-            check=True,
-        )
+        rate, data = sound
+        sd.play(data, rate)
         sd.wait()
-    except subprocess.CalledProcessError as e:
+    except sd.PortAudioError as e:
         print(f"Error while playing sound: {e}")
 
 
 def audio_callback(indata, frames, time, status):
     global porcupine
-    pcm = np.int16(indata[:, 0] * 32767)
-    result = porcupine.process(pcm)
-
-    if result >= 0:
-        # Stop Wake Word detected
-        stop_flag.set()  # Set the flag to stop GPT and audio streaming.
+    # The block holds several Porcupine frames; view it as one frame per row (no copy)
+    for pcm in indata[:, 0].reshape(-1, porcupine.frame_length):
+        if porcupine.process(pcm) >= 0:
+            # Stop Wake Word detected
+            stop_flag.set()  # Set the flag to stop GPT and audio streaming.
+            break
 
 
 def listen_for_wakeword():
@@ -271,8 +312,9 @@ def listen_for_wakeword():
         with sd.InputStream(
             samplerate=porcupine.sample_rate,
             channels=1,
+            dtype="int16",
             callback=audio_callback,
-            blocksize=porcupine.frame_length,
+            blocksize=porcupine.frame_length * wakeword_frames_per_block,
         ):
             print("Listening for 'Hey Rachel'...")
             while not stop_flag.is_set():
@@ -285,40 +327,42 @@ def listen_for_wakeword():
 
 def speak(text):
     samplerate = 24000  # Set the sample rate to match the response
-    chunk_size = 1024  # Original chunk size
-    buffer_size = 100  # Collect chunks before playing
-    audio_buffer = []
+    chunk_size = 512  # Small HTTP chunks so audio arrives in fine-grained pieces
+    buffer_size = 2  # ~20 ms of audio before playback starts; raise to 4 on underruns
+    buffer_bytes = buffer_size * chunk_size
+    # Raw PCM collected until there is enough to play; extended in place instead of
+    # concatenating per-chunk arrays
+    audio_buffer = bytearray()
 
     # Open a sounddevice stream to continuously play audio
-    with sd.OutputStream(samplerate=samplerate, channels=1, dtype="int16") as stream:
+    with sd.OutputStream(
+        samplerate=samplerate,
+        channels=1,
+        dtype="int16",
+        blocksize=chunk_size // 2,
+        latency=tts_latency,
+    ) as stream:
 
         with client.audio.speech.with_streaming_response.create(
             model="tts-1", voice="nova", input=text, response_format="pcm"
         ) as response:
             for chunk in response.iter_bytes(chunk_size):
-                # Convert the chunk to a NumPy array
-                audio_data = np.frombuffer(chunk, dtype=np.int16)
-
                 # Buffer the audio chunks
-                audio_buffer.append(audio_data)
+                audio_buffer.extend(chunk)
 
                 # if collected enough chunks, start playing
-                if len(audio_buffer) >= buffer_size:
-                    complete_audio = np.concatenate(audio_buffer)
-
+                if len(audio_buffer) >= buffer_bytes:
                     # Write directly to the stream without waiting
-                    stream.write(complete_audio)
+                    stream.write(np.frombuffer(audio_buffer, dtype=np.int16))
 
                     # clear buffer for the next block
-                    audio_buffer = []
+                    audio_buffer.clear()
 
             # Spiele verbleibende Audio-Chunks nach dem Empfang ab
             if audio_buffer:
-                complete_audio = np.concatenate(audio_buffer)
-                stream.write(complete_audio)
+                stream.write(np.frombuffer(audio_buffer, dtype=np.int16))
 
-        # Wait a short moment to ensure all data is played before closing the stream
-        sd.sleep(500)
+        # Leaving the with block stops the stream, which drains the queued audio
 
 
 def stream_chat_with_gpt_and_speak(
@@ -418,8 +462,6 @@ def stream_chat_with_gpt_and_speak(
                             # Entferne mögliche zusätzliche Leerzeichen
                             arguments_str = function_call_arguments.strip()
                             # Parsen der Arguments aus dem String
-                            import json
-
                             arguments = json.loads(arguments_str)
                             command = arguments.get("command")
                             print("command")
@@ -487,16 +529,17 @@ if __name__ == "__main__":
         0, {"role": "system", "content": "You are a helpful assistant."}
     )
 
+    # Decode the prompt sounds up front so playing them is a single write
+    for sound_name in ("sent.wav", "standby.wav"):
+        load_sound(os.path.join(script_dir, "../../resources/sounds", sound_name))
+
     while True:
         # Dynamically record audio until silence is detected
         audio = record_audio(sample_rate)
-        save_audio_to_wav(audio, sample_rate)
         play_sound(os.path.join(script_dir, "../../resources/sounds/sent.wav"))
-        # Transcribe the saved audio file using OpenAI API
-        user_input = transcribe_audio(output_file)
+        # Transcribe the recorded audio using OpenAI API
+        user_input = transcribe_audio(audio, sample_rate)
         print(f"You: {user_input}")
-        # Delete the WAV file after transcription
-        delete_wav_file(output_file)
 
         # Stream the transcribed input to GPT and speak it in real-time
         reply = stream_chat_with_gpt_and_speak(client, user_input, conversation_history)
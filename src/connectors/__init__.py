@@ -1,9 +1,12 @@
+"""Lazy exports for API connectors.
+
+Each connector pulls in its third-party SDK (openai, spotipy, pyowm, ...), so they are
+only imported on first access instead of at package import time.
+"""
+
+from importlib import import_module
+
 from ._connector_interface import ConnectorInterface
-from .crypto import CoinGeckoConnector
-from .email import ImapConnector, SmtpConnector
-from .media import SpotifyConnector
-from .openai import OpenAiConnector, StreamSplitter
-from .weather import OpenWeatherMapConnector
 
 __all__ = [
     "OpenAiConnector",
@@ -15,3 +18,27 @@ __all__ = [
     "SpotifyConnector",
     "ConnectorInterface",
 ]
+
+_MODULE_BY_ATTR = {
+    "OpenAiConnector": ".openai",
+    "StreamSplitter": ".openai",
+    "SmtpConnector": ".email",
+    "ImapConnector": ".email",
+    "OpenWeatherMapConnector": ".weather",
+    "CoinGeckoConnector": ".crypto",
+    "SpotifyConnector": ".media",
+}
+
+
+def __getattr__(name: str):
+    if name not in _MODULE_BY_ATTR:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = import_module(_MODULE_BY_ATTR[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(__all__))
@@ -3,6 +3,7 @@ This module defines the OpenAiConnector class, which provides functionality for
 and managing a connection to the OpenAI API using an API key.
 """
 
+import httpx
 from openai import OpenAI
 
 from .._connector_interface import ConnectorInterface
@@ -19,15 +20,36 @@ class OpenAiConnector(ConnectorInterface):
     Attributes:
         client (OpenAI): The OpenAI client initialized with the provided API key, used to
         make requests to OpenAI's various models and services.
+        http_client (httpx.Client): The pooled HTTP client shared by every OpenAI client this
+        connector creates, so TCP/TLS connections survive reconnects and pauses between turns.
 
     Methods:
         (Currently, no specific methods are defined. The client can be accessed directly for making
         API requests.)
     """
 
+    # Keep idle connections long enough to span the pause between two conversation turns;
+    # httpx would otherwise drop them after 5 seconds
+    KEEPALIVE_EXPIRY = 60.0
+    MAX_KEEPALIVE_CONNECTIONS = 8
+    # Same request timeouts the OpenAI SDK applies to the client it creates itself
+    TIMEOUT = httpx.Timeout(600.0, connect=5.0)
+
     def __init__(self, api_key: str):
         self.api_key = api_key
-        self.client = OpenAI(api_key=api_key)
+        self.http_client = httpx.Client(
+            timeout=self.TIMEOUT,
+            limits=httpx.Limits(
+                max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=self.KEEPALIVE_EXPIRY,
+            ),
+            follow_redirects=True,
+        )
+        self.client = OpenAI(api_key=api_key, http_client=self.http_client)
 
     def connect(self):
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = OpenAI(api_key=self.api_key, http_client=self.http_client)
+
+    def close(self):
+        """Closes the pooled HTTP connections."""
+        self.http_client.close()
@@ -4,56 +4,91 @@ chunks and allows multiple consumers to access the same data stream in real-time
 consuming it from the source.
 """
 
-from threading import Thread
+from queue import Queue
+from threading import Lock, Thread
 from typing import Any, List
 
 from openai._streaming import Stream
 from openai.types.chat.chat_completion_chunk import ChatCompletionChunk
 
+# Marker put on every consumer queue once the source stream is exhausted
+_END_OF_STREAM = object()
+
 
 class StreamSplitter:
     """
     A class to split a stream of data into chunks that can be consumed by multiple consumers.
 
     This class reads an iterator-based data stream (e.g., API responses that arrive in real-time)
-    and stores the data chunks internally. It allows multiple consumers to access the same stream
-    of data without consuming it directly from the source, ensuring that all consumers have access
-    to the entire stream.
+    and fans every chunk out to one queue per registered consumer. It allows multiple consumers to
+    access the same stream of data without consuming it directly from the source, ensuring that
+    all consumers have access to the entire stream.
 
     Attributes:
         stream (Stream[ChatCompletionChunk]): The input data stream that will be processed.
-        chunks (List[Any]): A list to store the chunks of data as they are read from the stream.
+        chunks (List[Any]): The chunks read so far, used to replay the stream to consumers that
+            register after reading has started.
         finished (bool): A flag indicating whether the reading of the stream has finished.
 
     Methods:
         start():
-            Starts reading the stream in a separate thread and stores each chunk in the chunks list.
+            Starts reading the stream in a separate thread and hands each chunk to the consumers.
+        register() -> Queue:
+            Returns a new consumer queue, pre-filled with the chunks read so far.
         get() -> Iterator[Any]:
-            Yields chunks of data from the list as they become available, allowing multiple
-            consumers to access the same data in real-time.
+            Yields chunks of data from a consumer queue as they become available, allowing
+            multiple consumers to access the same data in real-time.
     """
 
     def __init__(self, stream: Stream[ChatCompletionChunk]):
         self.stream = stream
         self.chunks: List[Any] = []
         self.finished = False
+        self._consumers: List[Queue] = []
+        self._lock = Lock()
 
     def start(self):
-        """Starts reading the stream and feeding it into the list."""
+        """Starts reading the stream and feeding it into the consumer queues."""
 
         def _read_stream():
-            for chunk in self.stream:
-                self.chunks.append(chunk)
-            self.finished = True
+            try:
+                for chunk in self.stream:
+                    with self._lock:
+                        self.chunks.append(chunk)
+                        for consumer in self._consumers:
+                            consumer.put(chunk)
+            finally:
+                with self._lock:
+                    self.finished = True
+                    for consumer in self._consumers:
+                        consumer.put(_END_OF_STREAM)
+                    self._consumers.clear()
 
         Thread(target=_read_stream, daemon=True).start()
 
-    def get(self) -> Stream[ChatCompletionChunk]:
-        """Yields items from the chunks list as they are read from the stream."""
-        index = 0
-        while not self.finished or index < len(self.chunks):
-            if index < len(self.chunks):
-                yield self.chunks[index]
-                index += 1
+    def register(self) -> Queue:
+        """Creates a consumer queue that replays the chunks read so far and receives new ones."""
+        consumer: Queue = Queue()
+        with self._lock:
+            for chunk in self.chunks:
+                consumer.put(chunk)
+            if self.finished:
+                consumer.put(_END_OF_STREAM)
             else:
-                continue  # Wait until more chunks are available or finished
+                self._consumers.append(consumer)
+        return consumer
+
+    def get(self) -> Stream[ChatCompletionChunk]:
+        """Yields items from a dedicated consumer queue as they are read from the stream."""
+        consumer = self.register()
+        try:
+            while True:
+                # Blocks until the reader hands over the next chunk
+                chunk = consumer.get()
+                if chunk is _END_OF_STREAM:
+                    return
+                yield chunk
+        finally:
+            with self._lock:
+                if consumer in self._consumers:
+                    self._consumers.remove(consumer)
@@ -1,15 +1,36 @@
+import threading
+from typing import Dict
+
 import pyowm
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.entities import TTLCache
 
 from .._connector_interface import ConnectorInterface
 
+# pyowm.OWM builds its configuration and manager registry on construction, so one client per
+# API key is shared by all connectors. Only the per-connector weather manager is bound to the
+# connector's own session.
+_CLIENTS: Dict[str, pyowm.OWM] = {}
+_CLIENTS_LOCK = threading.Lock()
+
 
 class OpenWeatherMapConnector(ConnectorInterface):
     """
     A connector class for handling weather data retrieval via the OpenWeatherMap API.
 
     This class manages the connection details and API interaction required to get weather data.
+    All requests go through one pooled requests.Session, so consecutive lookups reuse the
+    same keep-alive connection instead of paying a TCP/TLS handshake each time.
+    Weather and forecast lookups are cached for a few minutes, since the data behind them
+    changes far more slowly than users ask for it.
     """
 
+    CACHE_TTL_SECONDS = 300
+    CACHE_MAX_ENTRIES = 512
+
     def __init__(self, api_key: str):
         """
         Initializes the connector with the OpenWeatherMap API key.
@@ -19,14 +40,84 @@ class OpenWeatherMapConnector(ConnectorInterface):
         """
         self.api_key = api_key
         self.client = None
+        self._weather_manager = None
+        self._cache = TTLCache(self.CACHE_TTL_SECONDS, self.CACHE_MAX_ENTRIES)
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504]
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     def connect(self):
         """
-        Initializes the connection to the OpenWeatherMap API.
+        Initializes the connection to the OpenWeatherMap API, reusing the process-wide client
+        for this API key if another connector already created it.
+        """
+        if self.client is not None:
+            return
+
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(self.api_key)
+            if client is None:
+                try:
+                    client = pyowm.OWM(self.api_key)
+                except Exception as e:
+                    raise ConnectionError(
+                        f"Failed to initialize OpenWeatherMap connection: {e}"
+                    )
+                _CLIENTS[self.api_key] = client
+        self.client = client
+
+    def weather_manager(self):
+        """
+        Returns the weather manager of the connected client, routed through the pooled session.
+
+        pyowm builds a new manager (and HTTP client) on every ``weather_manager()`` call and,
+        without a retry configuration, sends its requests through the bare ``requests`` module.
+        The manager is therefore created once and its HTTP client pointed at ``self.session``.
+        """
+        self.connect()
+        if self._weather_manager is None:
+            manager = self.client.weather_manager()
+            manager.http_client.http = self.session
+            self._weather_manager = manager
+        return self._weather_manager
+
+    def weather_at_place(self, place: str):
+        """
+        Returns the current weather observation for a place, served from the cache when a
+        lookup for the same place happened within the last CACHE_TTL_SECONDS.
+
+        Args:
+            place (str): The place name, e.g. "Berlin,DE".
+        """
+        return self._cache.get_or_fetch(
+            ("weather", place.strip().lower()),
+            lambda: self.weather_manager().weather_at_place(place),
+        )
+
+    def forecast_at_place(self, place: str, interval: str = "3h"):
+        """
+        Returns the forecast for a place, served from the cache when the same forecast was
+        fetched within the last CACHE_TTL_SECONDS.
+
+        Args:
+            place (str): The place name, e.g. "Berlin,DE".
+            interval (str): The forecast interval supported by pyowm ("3h" or "daily").
+        """
+        return self._cache.get_or_fetch(
+            ("forecast", place.strip().lower(), interval),
+            lambda: self.weather_manager().forecast_at_place(place, interval),
+        )
+
+    def close(self):
+        """
+        Closes the pooled HTTP connections.
         """
-        try:
-            self.client = pyowm.OWM(self.api_key)
-        except Exception as e:
-            raise ConnectionError(
-                f"Failed to initialize OpenWeatherMap connection: {e}"
-            )
+        self.session.close()
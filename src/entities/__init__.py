@@ -1,5 +1,35 @@
-from .audio_record_result import AudioRecordResult
+"""Lazy exports for entities.
+
+Each entity is only imported on first access, so the light helpers (TTLCache, RequestCoalescer) do not pull
+NumPy into modules that never touch audio.
+"""
+
+from importlib import import_module
 
 __all__ = [
     "AudioRecordResult",
+    "AudioRingBuffer",
+    "RequestCoalescer",
+    "TTLCache",
 ]
+
+_MODULE_BY_ATTR = {
+    "AudioRecordResult": ".audio_record_result",
+    "AudioRingBuffer": ".audio_ring_buffer",
+    "RequestCoalescer": ".request_coalescer",
+    "TTLCache": ".ttl_cache",
+}
+
+
+def __getattr__(name: str):
+    if name not in _MODULE_BY_ATTR:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = import_module(_MODULE_BY_ATTR[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(__all__))
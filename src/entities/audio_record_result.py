@@ -3,7 +3,7 @@ This module defines the AudioRecordResult class, which encapsulates the result o
 recording operation, including the success status, recorded audio data, and silence timeout status.
 """
 
-from typing import Optional
+from typing import Callable, Optional
 
 import numpy as np
 
@@ -22,14 +22,35 @@ class AudioRecordResult:
             if the recording was not successful or if no audio data was captured.
         silence_timeout (bool): Indicates whether the recording was stopped due to a silence
             timeout, meaning that no speech was detected for a specified duration.
+        view (bool): Indicates whether data is a read-only view into a capture buffer owned by
+            the recorder. Such data is only valid until release() is called; consumers that
+            want to keep it longer must copy it.
     """
 
+    # One result is created per recording attempt; slots avoid a per-instance __dict__
+    __slots__ = ("success", "data", "silence_timeout", "view", "_release")
+
     def __init__(
         self,
         success: bool,
         data: Optional[np.ndarray] = None,
         silence_timeout: bool = False,
+        view: bool = False,
+        release: Optional[Callable[[], None]] = None,
     ):
         self.success = success
         self.data = data
         self.silence_timeout = silence_timeout
+        self.view = view
+        self._release = release
+
+    def release(self) -> None:
+        """
+        Hands the capture buffer behind a view back to the recorder so the next recording can
+        reuse it. The data of a view is dropped afterwards. Calling it again has no effect.
+        """
+        callback, self._release = self._release, None
+        if callback is not None:
+            callback()
+        if self.view:
+            self.data = None
@@ -0,0 +1,86 @@
+"""
+This module defines the AudioRingBuffer class, a fixed-size NumPy buffer that captured audio
+is written into in place, so recordings need no per-frame allocations.
+"""
+
+import numpy as np
+
+
+class AudioRingBuffer:
+    """
+    A preallocated, fixed-capacity ring buffer for 16-bit audio samples.
+
+    Samples are copied straight into the backing array. When more samples are written than
+    the buffer can hold, the oldest ones are overwritten, so the buffer always holds the most
+    recent ``capacity`` samples. Reading returns a zero-copy, read-only view as long as the
+    stored samples do not wrap around the end of the array; only a wrapped buffer is joined
+    with a single copy.
+
+    Attributes:
+        capacity (int): The maximum number of samples the buffer holds.
+        buffer (np.ndarray): The preallocated backing array.
+    """
+
+    __slots__ = ("capacity", "buffer", "_start", "_size")
+
+    def __init__(self, capacity: int, dtype=np.int16):
+        if capacity <= 0:
+            raise ValueError(f"Invalid capacity: {capacity}. Must be greater than 0.")
+
+        self.capacity = capacity
+        self.buffer = np.empty(capacity, dtype=dtype)
+        self._start = 0  # Index of the oldest stored sample
+        self._size = 0  # Number of stored samples
+
+    def __len__(self) -> int:
+        return self._size
+
+    def write(self, samples: np.ndarray) -> None:
+        """
+        Appends samples, overwriting the oldest ones if the buffer runs full.
+
+        :param samples: One-dimensional array of samples to append.
+        """
+        count = samples.size
+        if count == 0:
+            return
+
+        if count >= self.capacity:
+            # Only the newest samples fit; they fill the whole buffer
+            self.buffer[:] = samples[-self.capacity:]
+            self._start = 0
+            self._size = self.capacity
+            return
+
+        position = (self._start + self._size) % self.capacity
+        first_part = min(count, self.capacity - position)
+        self.buffer[position: position + first_part] = samples[:first_part]
+        if first_part < count:
+            # Wrap around to the beginning of the backing array
+            self.buffer[: count - first_part] = samples[first_part:]
+
+        self._size += count
+        if self._size > self.capacity:
+            self._start = (self._start + self._size - self.capacity) % self.capacity
+            self._size = self.capacity
+
+    def view(self) -> np.ndarray:
+        """
+        Returns the stored samples in order, oldest first. The result is a read-only view
+        into the buffer unless the samples wrap around, in which case it is a single copy.
+        Views are only valid until the buffer is released or written again.
+        """
+        end = self._start + self._size
+        if end <= self.capacity:
+            samples = self.buffer[self._start: end]
+        else:
+            samples = np.concatenate(
+                (self.buffer[self._start:], self.buffer[: end - self.capacity])
+            )
+        samples.flags.writeable = False
+        return samples
+
+    def release(self) -> None:
+        """Discards the stored samples so the buffer can be reused from its start."""
+        self._start = 0
+        self._size = 0
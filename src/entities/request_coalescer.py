@@ -0,0 +1,59 @@
+"""
+This module defines the RequestCoalescer class, which lets concurrent identical requests share
+a single run instead of each calling the underlying service or command again.
+"""
+
+import concurrent.futures
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class RequestCoalescer:
+    """
+    Runs a request once for all callers that ask for the same key at the same time.
+
+    The first caller for a key runs it; callers arriving while it runs wait for that result,
+    or re-raise its error. Entries only live while the request runs, so nothing is cached.
+    """
+
+    __slots__ = ("_inflight", "_lock")
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._inflight)
+
+    def run(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """
+        Runs fetch, or waits for the identical request another thread is already running and
+        returns its result.
+
+        Args:
+            key (Hashable): Identifies identical requests.
+            fetch (Callable[[], Any]): Performs the request.
+
+        Returns:
+            Any: The result of fetch.
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            is_owner = future is None
+            if is_owner:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
+
+        if not is_owner:
+            return future.result()
+
+        try:
+            result = fetch()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
@@ -0,0 +1,70 @@
+"""
+This module defines the TTLCache class, a small thread-safe cache whose entries expire after a
+fixed time, used to serve repeated lookups of slowly changing remote data without a round trip.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    A bounded, thread-safe cache of fetched values that expire after ttl_seconds.
+
+    Values are fetched outside the lock, so a slow fetch does not block lookups of other keys.
+    Only successful fetches are stored; errors propagate to the caller. Once max_entries is
+    reached, the oldest entry is evicted.
+
+    Attributes:
+        ttl_seconds (float): How long a stored value is served, unless overridden per entry.
+        max_entries (int): The maximum number of stored values.
+    """
+
+    __slots__ = ("ttl_seconds", "max_entries", "_entries", "_lock")
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_fetch(
+        self, key: Hashable, fetch: Callable[[], Any], ttl_seconds: Optional[float] = None
+    ) -> Any:
+        """
+        Returns the stored value for key if it has not expired, otherwise fetches and stores it.
+
+        Args:
+            key (Hashable): The cache key.
+            fetch (Callable[[], Any]): Produces the value on a miss.
+            ttl_seconds (Optional[float]): Lifetime of this entry instead of the default.
+
+        Returns:
+            Any: The cached or freshly fetched value.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+        value = fetch()
+
+        if ttl_seconds is None:
+            ttl_seconds = self.ttl_seconds
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.max_entries:
+                # Evict the oldest entry; dicts keep insertion order
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (now + ttl_seconds, value)
+        return value
+
+    def pop(self, key: Hashable) -> None:
+        """Removes the entry for key, so the next lookup fetches it again."""
+        with self._lock:
+            self._entries.pop(key, None)
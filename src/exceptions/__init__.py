@@ -1,9 +1,10 @@
-from .audio_recording_failed import AudioRecordingFailed
-from .audio_transcription_failed import AudioTranscriptionFailed
-from .email_deletion_error import EmailDeletionError
-from .email_listing_error import EmailListingError
-from .email_not_found import EmailNotFound
-from .function_not_found import FunctionNotFound
+"""Lazy exports for exceptions.
+
+Each exception class is only imported on first access, so importing one of them does not
+load the modules of all the others.
+"""
+
+from importlib import import_module
 
 __all__ = [
     "AudioRecordingFailed",
@@ -13,3 +14,26 @@ __all__ = [
     "EmailListingError",
     "FunctionNotFound",
 ]
+
+_MODULE_BY_ATTR = {
+    "AudioRecordingFailed": ".audio_recording_failed",
+    "AudioTranscriptionFailed": ".audio_transcription_failed",
+    "EmailNotFound": ".email_not_found",
+    "EmailDeletionError": ".email_deletion_error",
+    "EmailListingError": ".email_listing_error",
+    "FunctionNotFound": ".function_not_found",
+}
+
+
+def __getattr__(name: str):
+    if name not in _MODULE_BY_ATTR:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = import_module(_MODULE_BY_ATTR[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(__all__))
@@ -1,11 +1,14 @@
+"""Lazy exports for executors.
+
+ExecutorInterface and CommandExecutor are light and imported eagerly. The other executors
+are only imported on first access, so their service dependencies (spotipy, pyowm, bs4,
+imaplib, ...) stay out of the start-up path until they are actually needed.
+"""
+
+from importlib import import_module
+
 from ._executor_interface import ExecutorInterface
 from .command_executor import CommandExecutor
-from .contact_executor import ContactExecutor
-from .crypto_data_executor import CryptoDataExecutor
-from .email_executor import EmailExecutor
-from .spotify_executor import SpotifyExecutor
-from .weather_executor import WeatherExecutor
-from .web_scraper_executor import WebScraperExecutor
 
 __all__ = [
     "ExecutorInterface",
@@ -17,3 +20,26 @@ __all__ = [
     "CryptoDataExecutor",
     "SpotifyExecutor",
 ]
+
+_MODULE_BY_ATTR = {
+    "EmailExecutor": ".email_executor",
+    "ContactExecutor": ".contact_executor",
+    "WeatherExecutor": ".weather_executor",
+    "WebScraperExecutor": ".web_scraper_executor",
+    "CryptoDataExecutor": ".crypto_data_executor",
+    "SpotifyExecutor": ".spotify_executor",
+}
+
+
+def __getattr__(name: str):
+    if name not in _MODULE_BY_ATTR:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = import_module(_MODULE_BY_ATTR[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals().keys()) | set(__all__))
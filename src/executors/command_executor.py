@@ -1,35 +1,123 @@
 """
 This module defines the CommandExecutor class, which implements the ExecutorInterface to execute
-system commands on a specified platform shell. It supports the execution of commands by writing
-them to a temporary shell script and capturing the output, allowing integration with GPT command
-execution requests.
+system commands on a specified platform shell. It supports the execution of commands by passing
+them to bash and capturing the output, allowing integration with GPT command execution requests.
 """
 
+import asyncio
+import functools
+import os
+import re
+import selectors
+import signal
 import subprocess
-import tempfile
-from typing import Any, Dict
+import threading
+import time
+from typing import Any, Dict, Optional, Pattern, Sequence, Tuple
+
+from src.entities import RequestCoalescer
 
 from ._executor_interface import ExecutorInterface
 
+# BSD sed on macOS requires a backup suffix after -i; an empty one ('') edits in place
+_MACOS_REWRITES: Sequence[Tuple[Pattern[str], str]] = (
+    (re.compile(r"\bsed -i(?=\s)(?!\s+(?:''|\"\"))"), "sed -i ''"),
+)
+
+# Read-only commands without redirections, pipes or substitutions. Identical calls of these
+# that overlap in time share one execution instead of spawning the same process twice.
+_COALESCABLE_COMMAND = re.compile(
+    r"^(?:ls|cat|df|du|ps|free|uptime|date|whoami|pwd|uname|hostname"
+    r"|git (?:status|log|diff))(?:\s[^;&|<>`$\n]*)?$"
+)
+
+# Command rewrites applied before execution, chosen once per platform
+_PLATFORM_REWRITES: Dict[str, Sequence[Tuple[Pattern[str], str]]] = {
+    "mac-os": _MACOS_REWRITES,
+    "macos": _MACOS_REWRITES,
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _interpreter_instructions(user_language: str) -> str:
+    return (
+        "Analyze the user's request and provide the response as briefly as possible. "
+        "If the user's request contains indications for specific details, a list, or "
+        "extended information, provide an appropriately detailed response. If unsure whether "
+        "further details are needed, ask the user. "
+        "If the command timed out, tell the user it took too long and was stopped. "
+        f"Always respond in the language '{user_language}'. "
+    )
+
 
 class CommandExecutor(ExecutorInterface):
     """
     A class to execute system commands on a specified platform shell.
 
     This class implements the ExecutorInterface and provides methods to define,
-    execute, and interpret system commands. Commands are written to a temporary
-    shell script file, which is then executed to capture and return the output or errors.
+    execute, and interpret system commands. Commands are handed to bash directly
+    (``bash -c``), which is executed to capture and return the output or errors.
 
     Attributes:
         platform (str): The platform (e.g., "linux", "macos") on which commands are executed.
         user_language (str): The language in which results should be interpreted and presented.
+        timeout (float): Seconds a command may run before its whole process group is terminated.
+        max_parallel (int): Maximum number of commands running at the same time, for exec and
+            exec_async alike. Defaults to the number of CPUs.
+        max_output_bytes (int): Bytes captured per stream before the command is terminated.
+            Defaults to MAX_OUTPUT_BYTES, so everything captured can be returned.
     """
 
-    def __init__(self, platform: str, user_language: str = "en"):
+    __slots__ = (
+        "platform",
+        "user_language",
+        "timeout",
+        "max_parallel",
+        "max_output_bytes",
+        "_semaphore",
+        "_async_semaphore",
+        "_async_semaphore_loop",
+        "_inflight",
+        "_rewrites",
+        "_definition",
+    )
+
+    # At most this many bytes of stdout and stderr are returned to GPT: the tail of complete
+    # output, or the head of output that was cut off by max_output_bytes
+    MAX_OUTPUT_BYTES = 65536
+    # Size of a single read from the command's pipes
+    READ_CHUNK_BYTES = 65536
+    TRUNCATION_MARKER = "\n... [output truncated, command terminated]"
+
+    def __init__(
+        self,
+        platform: str,
+        user_language: str = "en",
+        timeout: float = 30.0,
+        max_parallel: Optional[int] = None,
+        max_output_bytes: int = MAX_OUTPUT_BYTES,
+    ):
         self.platform = platform
         self.user_language = user_language
+        self.timeout = timeout
+        self.max_parallel = max_parallel or os.cpu_count() or 4
+        self.max_output_bytes = max_output_bytes
+        # Bounds concurrent bash processes of exec, so a burst of calls cannot fork-storm
+        self._semaphore = threading.BoundedSemaphore(self.max_parallel)
+        # asyncio primitives belong to one event loop, so the semaphore is created lazily
+        self._async_semaphore: Optional[asyncio.Semaphore] = None
+        self._async_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Coalescable commands that are currently running, keyed by command
+        self._inflight = RequestCoalescer()
+        # Platforms without rewrites get an empty tuple, so exec skips the loop entirely
+        self._rewrites = _PLATFORM_REWRITES.get(platform, ())
+        # The definition only depends on the platform, so it is built once
+        self._definition = self._build_definition()
 
     def get_executor_definition(self) -> Dict[str, Any]:
+        return self._definition
+
+    def _build_definition(self) -> Dict[str, Any]:
         return {
             "type": "function",
             "function": {
@@ -52,45 +140,200 @@ class CommandExecutor(ExecutorInterface):
         command = arguments.get("command")
         if command:
             try:
-                # Schreibe das Kommando in eine temporäre Datei, um es direkt auszuführen
-                with tempfile.NamedTemporaryFile(
-                    "w", delete=False, suffix=".sh"
-                ) as temp_file:
-                    # Schreibe den Befehl und überprüfe die Syntax für sed -i '' auf macOS
-                    if "sed -i ''" in command:
-                        command = command.replace("sed -i ''", "sed -i ''")
-                    temp_file.write(command)
-                    temp_file_path = temp_file.name
-
-                # execute temp file in shell
-                result = subprocess.run(
-                    f"bash {temp_file_path}", shell=True, capture_output=True, text=True,
-                    check=False
-                )
-
-                # remove temp file
-                temp_file.close()
-
-                # combine stdout und stderr to get all infos
-                output = result.stdout.strip()
-                error = result.stderr.strip()
-
-                if result.returncode == 0:
-                    return output if output else "Command executed successfully."
-
-                return (
-                    f"Command returned non-zero exit code {result.returncode}.\n"
-                    f"Output: {output}\nError: {error}"
-                )
+                command = self._apply_rewrites(command)
+                if _COALESCABLE_COMMAND.match(command):
+                    return self._inflight.run(command, lambda: self._run_command(command))
+                return self._run_command(command)
             except Exception as e:
                 return f"Error executing command: {e}"
         return "No command provided."
 
-    def get_result_interpreter_instructions(self, user_language: str = "en") -> str:
+    def _run_command(self, command: str) -> str:
+        # Übergib das Kommando direkt an bash, ohne temporäre Datei und /bin/sh.
+        # Eine eigene Prozessgruppe erlaubt es, bei Timeout alle Kindprozesse zu beenden.
+        with self._semaphore:
+            process = subprocess.Popen(
+                ["bash", "-c", command],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=0,
+                start_new_session=True,
+            )
+            stdout, stderr, truncated, timed_out = self._capture_output(process)
+            if timed_out:
+                self._kill_process_group(process)
+                if not truncated:
+                    return f"Command timed out after {self.timeout:g} seconds and was terminated."
+            process.wait()
+
+        return self._format_result(process.returncode, stdout, stderr, truncated)
+
+    def _capture_output(self, process: subprocess.Popen) -> Tuple[bytearray, bytearray, bool, bool]:
+        """
+        Reads stdout and stderr of the command until both are closed or the timeout expires.
+        At most max_output_bytes are kept per stream; once a stream overflows, the command's
+        process group is terminated and the rest of its output is discarded.
+
+        Returns:
+            tuple: stdout, stderr, whether output was truncated and whether the command timed out.
+        """
+        chunk = memoryview(bytearray(self.READ_CHUNK_BYTES))
+        outputs = {process.stdout: bytearray(), process.stderr: bytearray()}
+        truncated = False
+        deadline = time.monotonic() + self.timeout
+
+        with selectors.DefaultSelector() as selector:
+            for pipe in outputs:
+                selector.register(pipe, selectors.EVENT_READ)
+            try:
+                while selector.get_map():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return outputs[process.stdout], outputs[process.stderr], truncated, True
+
+                    for key, _ in selector.select(remaining):
+                        count = key.fileobj.readinto(chunk)
+                        if not count:
+                            selector.unregister(key.fileobj)
+                        elif self._append_capped(outputs[key.fileobj], chunk[:count]):
+                            if not truncated:
+                                truncated = True
+                                self._signal_process_group(process.pid, signal.SIGTERM)
+            finally:
+                for pipe in outputs:
+                    pipe.close()
+
+        return outputs[process.stdout], outputs[process.stderr], truncated, False
+
+    def _append_capped(self, output: bytearray, data) -> bool:
+        """Appends data up to max_output_bytes and returns True if some of it did not fit."""
+        room = self.max_output_bytes - len(output)
+        if len(data) <= room:
+            output += data
+            return False
+        if room > 0:
+            output += data[:room]
+        return True
+
+    async def exec_async(self, arguments: Dict[str, Any]) -> str:
+        """
+        Asynchronous variant of exec. Commands started from several coroutines overlap their
+        waiting time instead of running one after another; at most max_parallel of them run
+        at once. Timeouts and results behave exactly like exec.
+        """
+        command = arguments.get("command")
+        if command:
+            try:
+                command = self._apply_rewrites(command)
+
+                async with self._get_async_semaphore():
+                    process = await asyncio.create_subprocess_exec(
+                        "bash",
+                        "-c",
+                        command,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                        start_new_session=True,
+                    )
+                    truncated = False
+
+                    async def read_capped(stream: asyncio.StreamReader) -> bytearray:
+                        nonlocal truncated
+                        output = bytearray()
+                        while data := await stream.read(self.READ_CHUNK_BYTES):
+                            if self._append_capped(output, data) and not truncated:
+                                truncated = True
+                                self._signal_process_group(process.pid, signal.SIGTERM)
+                        return output
+
+                    try:
+                        stdout, stderr = await asyncio.wait_for(
+                            asyncio.gather(
+                                read_capped(process.stdout), read_capped(process.stderr)
+                            ),
+                            timeout=self.timeout,
+                        )
+                        await process.wait()
+                    except asyncio.TimeoutError:
+                        await self._kill_process_group_async(process)
+                        return (
+                            f"Command timed out after {self.timeout:g} seconds "
+                            f"and was terminated."
+                        )
+
+                return self._format_result(process.returncode, stdout, stderr, truncated)
+            except Exception as e:
+                return f"Error executing command: {e}"
+        return "No command provided."
+
+    def _apply_rewrites(self, command: str) -> str:
+        for pattern, replacement in self._rewrites:
+            command = pattern.sub(replacement, command)
+        return command
+
+    @classmethod
+    def _format_result(
+        cls, returncode: int, stdout: bytes, stderr: bytes, truncated: bool = False
+    ) -> str:
+        # Output is captured as bytes and decoded exactly once here, capped at MAX_OUTPUT_BYTES
+        # so a chatty command cannot blow up the prompt
+        output = cls._decode_output(stdout, truncated)
+        error = cls._decode_output(stderr, truncated)
+
+        if truncated:
+            # The exit code is then our own SIGTERM, so it says nothing about the command
+            result = f"{output}{cls.TRUNCATION_MARKER}"
+            return f"{result}\nError: {error}" if error else result
+
+        if returncode == 0:
+            return output if output else "Command executed successfully."
+
         return (
-            "Analyze the user's request and provide the response as briefly as possible. "
-            "If the user's request contains indications for specific details, a list, or "
-            "extended information, provide an appropriately detailed response. If unsure whether "
-            "further details are needed, ask the user."
-            f"Always respond in the language '{user_language}'. "
+            f"Command returned non-zero exit code {returncode}.\n"
+            f"Output: {output}\nError: {error}"
         )
+
+    @classmethod
+    def _decode_output(cls, data: bytes, head: bool = False) -> str:
+        # Cut-off output keeps its start, since its real end was never read
+        data = data[:cls.MAX_OUTPUT_BYTES] if head else data[-cls.MAX_OUTPUT_BYTES:]
+        return data.decode("utf-8", errors="replace").strip()
+
+    def _get_async_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._async_semaphore is None or self._async_semaphore_loop is not loop:
+            self._async_semaphore = asyncio.Semaphore(self.max_parallel)
+            self._async_semaphore_loop = loop
+        return self._async_semaphore
+
+    @classmethod
+    async def _kill_process_group_async(cls, process: asyncio.subprocess.Process) -> None:
+        """Async counterpart of _kill_process_group."""
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            cls._signal_process_group(process.pid, sig)
+            try:
+                await asyncio.wait_for(process.communicate(), timeout=2)
+                return
+            except asyncio.TimeoutError:
+                continue
+
+    @classmethod
+    def _kill_process_group(cls, process: subprocess.Popen) -> None:
+        """Terminates the command's process group, escalating to SIGKILL if it lingers."""
+        for sig in (signal.SIGTERM, signal.SIGKILL):
+            cls._signal_process_group(process.pid, sig)
+            try:
+                process.wait(timeout=2)
+                return
+            except subprocess.TimeoutExpired:
+                continue
+
+    @staticmethod
+    def _signal_process_group(pid: int, sig: int) -> None:
+        try:
+            os.killpg(pid, sig)
+        except ProcessLookupError:
+            pass
+
+    def get_result_interpreter_instructions(self, user_language: str = "en") -> str:
+        return _interpreter_instructions(user_language)
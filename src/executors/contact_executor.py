@@ -4,10 +4,24 @@ to perform operations on a contacts service. It supports listing all contacts or
 searching for contacts by name or email.
 """
 
+import functools
+from itertools import chain
 from typing import Any, Dict
 
 from ._executor_interface import ExecutorInterface
 
+# Bound format method for one result row, shared by all calls
+_CONTACT_FMT = "Name: {}, Emails: {}, Phones: {}".format
+
+
+@functools.lru_cache(maxsize=16)
+def _interpreter_instructions(user_language: str) -> str:
+    return (
+        "Please summarize the contacts retrieved as short as possible and ask if the user "
+        "needs any further action."
+        f"Please always answer in Language '{user_language}'"
+    )
+
 
 class ContactExecutor(ExecutorInterface):
     """
@@ -21,10 +35,19 @@ class ContactExecutor(ExecutorInterface):
         contacts_service: The service used to access and manipulate contact data.
     """
 
+    __slots__ = ("contacts_service", "_definition", "_ops")
+
     def __init__(self, contacts_service):
         self.contacts_service = contacts_service
+        # The definition is static, so it is built once
+        self._definition = self._build_definition()
+        # Operation name -> bound handler, so exec needs a single lookup per call
+        self._ops = {"list": self._list_contacts, "search": self._search_contacts}
 
     def get_executor_definition(self) -> Dict[str, Any]:
+        return self._definition
+
+    def _build_definition(self) -> Dict[str, Any]:
         return {
             "type": "function",
             "function": {
@@ -54,29 +77,31 @@ class ContactExecutor(ExecutorInterface):
 
     def exec(self, arguments: Dict[str, Any]) -> str:
         operation = arguments.get("operation")
-        search_string = arguments.get("search_string", "")
-
-        if operation == "list":
-            contacts = self.contacts_service.list()
-        elif operation == "search":
-            contacts = self.contacts_service.list(search_string)
-        else:
+        handler = self._ops.get(operation)
+        if handler is None:
             return f"Invalid operation: {operation}"
+        return handler(arguments)
+
+    def _list_contacts(self, arguments: Dict[str, Any]) -> str:
+        return self._format_contacts(iter(self.contacts_service.iter()))
 
-        if not contacts:
+    def _search_contacts(self, arguments: Dict[str, Any]) -> str:
+        search_string = arguments.get("search_string", "")
+        return self._format_contacts(iter(self.contacts_service.iter(search_string)))
+
+    @staticmethod
+    def _format_contacts(contacts) -> str:
+        # Peek at the first contact so the empty case is detected without materializing a list
+        first_contact = next(contacts, None)
+        if first_contact is None:
             return "No contacts found."
 
         return "\n".join(
             [
-                f"Name: {contact['name']}, Emails: "
-                f"{', '.join(contact['emails'])}, Phones: {', '.join(contact['phones'])}"
-                for contact in contacts
+                _CONTACT_FMT(contact["name"], contact["emails_str"], contact["phones_str"])
+                for contact in chain((first_contact,), contacts)
             ]
         )
 
     def get_result_interpreter_instructions(self, user_language="en") -> str:
-        return (
-            "Please summarize the contacts retrieved as short as possible and ask if the user "
-            "needs any further action."
-            f"Please always answer in Language '{user_language}'"
-        )
+        return _interpreter_instructions(user_language)
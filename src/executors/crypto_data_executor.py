@@ -5,10 +5,23 @@ specified cryptocurrency. The data can be retrieved in a specified reference cur
 time range.
 """
 
+import functools
 from typing import Any, Dict
 
 from ._executor_interface import ExecutorInterface
 
+# Bound format method for one OHLC row; rows are [timestamp, open, high, low, close]
+_OHLC_FMT = "Date: {}, Open: {}, High: {}, Low: {}, Close: {}".format
+
+
+@functools.lru_cache(maxsize=16)
+def _interpreter_instructions(user_language: str) -> str:
+    return (
+        "Summarize the cryptocurrency data as short as possible and ask if the user "
+        "needs further information or action."
+        f"Please always answer in Language '{user_language}'"
+    )
+
 
 class CryptoDataExecutor(ExecutorInterface):
     """
@@ -21,8 +34,15 @@ class CryptoDataExecutor(ExecutorInterface):
 
     def __init__(self, crypto_data_service):
         self.crypto_data_service = crypto_data_service
+        # The definition is static, so it is built once
+        self._definition = self._build_definition()
+        # Operation name -> bound handler, so exec needs a single lookup per call
+        self._ops = {"ohlc": self._get_ohlc, "market": self._get_market_data}
 
     def get_executor_definition(self) -> Dict[str, Any]:
+        return self._definition
+
+    def _build_definition(self) -> Dict[str, Any]:
         return {
             "type": "function",
             "function": {
@@ -65,60 +85,51 @@ class CryptoDataExecutor(ExecutorInterface):
     def exec(self, arguments: Dict[str, Any]) -> str:
         operation = arguments.get("operation")
         coin_id = arguments.get("coin_id")
-        vs_currency = arguments.get("vs_currency", "usd")
-        days = arguments.get("days", 7)
 
         if not coin_id:
             return "Please provide a valid cryptocurrency coin ID."
 
-        result = ""
+        handler = self._ops.get(operation)
+        if handler is None:
+            return f"Invalid operation: {operation}"
 
         try:
-            if operation == "ohlc":
-                # get ohlc data
-                ohlc_data = self.crypto_data_service.get_ohlc(
-                    coin_id=coin_id, vs_currency=vs_currency, days=days
-                )
-                if not ohlc_data:
-                    result = f"No OHLC data found for {coin_id}."
-                else:
-                    # format ohlc data
-                    formatted_data = "\n".join(
-                        [
-                            f"Date: {ohlc[0]}, "
-                            f"Open: {ohlc[1]}, High: {ohlc[2]}, Low: {ohlc[3]}, Close: {ohlc[4]}"
-                            for ohlc in ohlc_data
-                        ]
-                    )
-                    result = f"OHLC data for " \
-                             f"{coin_id} (last {days} days in {vs_currency}):\n{formatted_data}"
-
-            elif operation == "market":
-                # get market data
-                market_data = self.crypto_data_service.get_market_data(
-                    coin_id=coin_id, vs_currency=vs_currency
-                )
-                if not market_data:
-                    result = f"No market data found for {coin_id}."
-                else:
-                    # format market data
-                    result = (
-                        f"Market data for {coin_id} in {vs_currency}:\n"
-                        f"Current Price: {market_data['current_price']}\n"
-                        f"Market Cap: {market_data['market_cap']}\n"
-                        f"24h Volume: {market_data['volume_24h']}"
-                    )
-            else:
-                result = f"Invalid operation: {operation}"
-
+            return handler(arguments)
         except Exception as e:
-            result = f"An error occurred while fetching data: {str(e)}"
+            return f"An error occurred while fetching data: {str(e)}"
 
-        return result
+    def _get_ohlc(self, arguments: Dict[str, Any]) -> str:
+        get = arguments.get
+        coin_id = get("coin_id")
+        vs_currency = get("vs_currency", "usd")
+        days = get("days", 7)
+
+        ohlc_data = self.crypto_data_service.get_ohlc(
+            coin_id=coin_id, vs_currency=vs_currency, days=days
+        )
+        if not ohlc_data:
+            return f"No OHLC data found for {coin_id}."
+
+        formatted_data = "\n".join([_OHLC_FMT(*ohlc) for ohlc in ohlc_data])
+        return f"OHLC data for " \
+               f"{coin_id} (last {days} days in {vs_currency}):\n{formatted_data}"
+
+    def _get_market_data(self, arguments: Dict[str, Any]) -> str:
+        coin_id = arguments.get("coin_id")
+        vs_currency = arguments.get("vs_currency", "usd")
+
+        market_data = self.crypto_data_service.get_market_data(
+            coin_id=coin_id, vs_currency=vs_currency
+        )
+        if not market_data:
+            return f"No market data found for {coin_id}."
 
-    def get_result_interpreter_instructions(self, user_language="en") -> str:
         return (
-            "Summarize the cryptocurrency data as short as possible and ask if the user "
-            "needs further information or action."
-            f"Please always answer in Language '{user_language}'"
+            f"Market data for {coin_id} in {vs_currency}:\n"
+            f"Current Price: {market_data['current_price']}\n"
+            f"Market Cap: {market_data['market_cap']}\n"
+            f"24h Volume: {market_data['volume_24h']}"
         )
+
+    def get_result_interpreter_instructions(self, user_language="en") -> str:
+        return _interpreter_instructions(user_language)
@@ -5,11 +5,42 @@ The EmailExecutor interacts with an email service and provides a structured inte
 handling user email requests with explicit confirmation and user prompts.
 """
 
+import asyncio
+import functools
 from datetime import datetime
-from typing import Any, Dict
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List
 
 from ._executor_interface import ExecutorInterface
 
+# Row fields of one listed email, extracted in a single C-level call, and the bound
+# %-template they are filled into
+_EMAIL_FIELDS = itemgetter("email_id", "from", "subject", "date")
+_EMAIL_FMT = "ID: %s, From: %s, Subject: %s, Date: %s".__mod__
+# Same row followed by the raw email content, used when bodies were requested
+_EMAIL_WITH_BODY_FIELDS = itemgetter("email_id", "from", "subject", "date", "body")
+_EMAIL_WITH_BODY_FMT = "ID: %s, From: %s, Subject: %s, Date: %s\nBody:\n%s".__mod__
+
+
+def _parse_date(value: str) -> datetime:
+    """Parses a 'YYYY-MM-DD' string, raising ValueError for anything else like strptime did."""
+    # fromisoformat also accepts times and the compact 'YYYYMMDD' form, so pin the shape first
+    if len(value) != 10 or value[4] != "-" or value[7] != "-":
+        raise ValueError(f"time data {value!r} does not match format '%Y-%m-%d'")
+    return datetime.fromisoformat(value)
+
+
+@functools.lru_cache(maxsize=16)
+def _interpreter_instructions(user_language: str) -> str:
+    return (
+        "Please summarize the result of the requested email operation as concisely and "
+        "clearly as possible. Ensure that any numbers "
+        "(such as counts of emails, file sizes, or other numerical values), dates, "
+        "and times are presented in a human-friendly format, with descriptive context."
+        f"Always answer in language '{user_language}'. "
+        "Ask if the user needs further actions or clarification."
+    )
+
 
 class EmailExecutor(ExecutorInterface):
     """
@@ -24,11 +55,25 @@ class EmailExecutor(ExecutorInterface):
         username (str): The name used in email signatures when sending emails.
     """
 
+    __slots__ = ("email_service", "username", "_definition", "_ops")
+
     def __init__(self, email_service, username: str):
         self.email_service = email_service
         self.username: str = username
+        # The definition only depends on the username, so it is built once
+        self._definition = self._build_definition()
+        # Operation name -> bound handler, so exec needs a single lookup per call
+        self._ops = {
+            "send": self._send_email,
+            "list": self._list_emails,
+            "get": self._get_email,
+            "delete": self._delete_email,
+        }
 
     def get_executor_definition(self) -> Dict[str, Any]:
+        return self._definition
+
+    def _build_definition(self) -> Dict[str, Any]:
         return {
             "type": "function",
             "function": {
@@ -36,7 +81,7 @@ class EmailExecutor(ExecutorInterface):
                 "description": (
                     "Performs various email operations like sending, listing emails, fetching, "
                     "or deleting specific emails. When sending an email, it must include the "
-                    "signature with some nice greetings and my name '{self.username}' at the end "
+                    f"signature with some nice greetings and my name '{self.username}' at the end "
                     "of the email body. Always do a new list function call and don't use results "
                     "from before! For the 'list' operation, at least one filter "
                     "(e.g., count, from_filter, subject_filter, unread_only, or a date range) must "
@@ -116,6 +161,14 @@ class EmailExecutor(ExecutorInterface):
                             "description": "End date for filtering emails "
                                            "(only used for 'list' operation)",
                         },
+                        "include_body": {
+                            "type": "boolean",
+                            "description": "If true, also return the body text of the listed "
+                                           "emails in the same request, instead of a separate "
+                                           "'get' per email. Only the most recent matching "
+                                           "emails are listed then (only used for 'list' "
+                                           "operation)",
+                        },
                     },
                     "required": ["operation"],
                 },
@@ -124,61 +177,80 @@ class EmailExecutor(ExecutorInterface):
 
     def exec(self, arguments: Dict[str, Any]) -> str:
         operation = arguments.get("operation")
+        handler = self._ops.get(operation)
+        if handler is None:
+            return f"Invalid operation: {operation}"
+        return handler(arguments)
 
-        if operation == "send":
-            return self._send_email(arguments)
+    async def exec_async(self, arguments: Dict[str, Any]) -> str:
+        """
+        Asynchronous variant of exec. Every email operation opens its own IMAP/SMTP connection,
+        so calls from several coroutines run in worker threads and overlap their network waits.
+        Results behave exactly like exec.
+        """
+        return await asyncio.to_thread(self.exec, arguments)
 
-        if operation == "list":
-            return self._list_emails(arguments)
+    def _send_email(self, arguments: Dict[str, Any]) -> str:
+        get = arguments.get
+        to = get("to")
+        subject = get("subject")
+        body = get("body")
+        return self.email_service.send(to, subject, body)
 
-        if operation == "get":
-            return self._get_email(arguments)
+    def iter_email_rows(self, arguments: Dict[str, Any]) -> Iterator[str]:
+        """
+        Lazily yields the formatted rows of a 'list' operation, one per email, instead of one
+        joined string. Callers that only need part of a long listing can stop early (e.g. with
+        itertools.islice) without the remaining rows ever being formatted.
 
-        if operation == "delete":
-            return self._delete_email(arguments)
+        Args:
+            arguments (Dict[str, Any]): The 'list' filters, as accepted by exec.
 
-        return f"Invalid operation: {operation}"
-
-    def _send_email(self, arguments: Dict[str, Any]) -> str:
-        to = arguments.get("to")
-        subject = arguments.get("subject")
-        body = arguments.get("body")
-        return self.email_service.send(to, subject, body)
+        Returns:
+            Iterator[str]: The rows exec would join; nothing if no email matched.
+        """
+        emails = self._fetch_emails(arguments)
+        if arguments.get("include_body", False):
+            return map(_EMAIL_WITH_BODY_FMT, map(_EMAIL_WITH_BODY_FIELDS, emails))
+        return map(_EMAIL_FMT, map(_EMAIL_FIELDS, emails))
 
     def _list_emails(self, arguments: Dict[str, Any]) -> str:
-        count = arguments.get("count")
-        from_filter = arguments.get("from_filter")
-        subject_filter = arguments.get("subject_filter")
-        unread_only = arguments.get("unread_only", False)
+        emails = self._fetch_emails(arguments)
+
+        if not emails:
+            return "No emails found."
+
+        if arguments.get("include_body", False):
+            return "\n\n".join(map(_EMAIL_WITH_BODY_FMT, map(_EMAIL_WITH_BODY_FIELDS, emails)))
+
+        return "\n".join(map(_EMAIL_FMT, map(_EMAIL_FIELDS, emails)))
+
+    def _fetch_emails(self, arguments: Dict[str, Any]) -> List[Dict[str, str]]:
+        get = arguments.get
+        count = get("count")
+        from_filter = get("from_filter")
+        subject_filter = get("subject_filter")
+        unread_only = get("unread_only", False)
+        include_body = get("include_body", False)
 
-        date_from = arguments.get("date_from")
-        date_to = arguments.get("date_to")
+        date_from = get("date_from")
+        date_to = get("date_to")
 
         if date_from:
-            date_from = datetime.strptime(date_from, "%Y-%m-%d")
+            date_from = _parse_date(date_from)
         if date_to:
-            date_to = datetime.strptime(date_to, "%Y-%m-%d")
+            date_to = _parse_date(date_to)
         if date_from or date_to:
             count = None  # Ignore count if date range is used
 
-        emails = self.email_service.list(
+        return self.email_service.list(
             count=count,
             from_filter=from_filter,
             subject_filter=subject_filter,
             unread_only=unread_only,
             date_from=date_from,
             date_to=date_to,
-        )
-
-        if not emails:
-            return "No emails found."
-
-        return "\n".join(
-            [
-                f"ID: {email['email_id']}, From: {email['from']}, "
-                f"Subject: {email['subject']}, Date: {email['date']}"
-                for email in emails
-            ]
+            include_body=include_body,
         )
 
     def _get_email(self, arguments: Dict[str, Any]) -> str:
@@ -199,16 +271,10 @@ class EmailExecutor(ExecutorInterface):
 
         try:
             self.email_service.delete(email_ids)
-            return f"Emails with IDs {email_ids} successfully deleted."
+            # The IDs are only spelled out on failure, where they help the user retry
+            return f"Successfully deleted {len(email_ids)} email(s)."
         except (RuntimeError, ValueError, KeyError) as e:
             return f"An error occurred while deleting emails with IDs {email_ids}: {str(e)}"
 
     def get_result_interpreter_instructions(self, user_language="en") -> str:
-        return (
-            "Please summarize the result of the requested email operation as concisely and "
-            "clearly as possible. Ensure that any numbers "
-            "(such as counts of emails, file sizes, or other numerical values), dates, "
-            "and times are presented in a human-friendly format, with descriptive context."
-            f"Always answer in language '{user_language}'. "
-            "Ask if the user needs further actions or clarification."
-        )
+        return _interpreter_instructions(user_language)
@@ -4,12 +4,197 @@ perform various operations with the Spotify API. The SpotifyExecutor class allow
 such as searching tracks, retrieving playlists, controlling playback, and managing user libraries.
 """
 
+import asyncio
+import functools
 import json
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is listed in requirements.txt
+    orjson = None
+
+from src.entities import TTLCache
 
 from ._executor_interface import ExecutorInterface
 
 
+def _dumps(obj: Any) -> str:
+    """
+    Serializes a Spotify API payload to compact JSON. orjson is a C extension and several
+    times faster on these nested dicts; the stdlib fallback produces the same text.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+@functools.lru_cache(maxsize=16)
+def _interpreter_instructions(user_language: str) -> str:
+    return (
+        "Interpret the Spotify response in a clear, user-friendly format. "
+        "Always retrieve fresh, real-time data for each request and avoid referring to any "
+        "chat history. Provide very brief and general responses, focusing on key points "
+        "like artist, album, and track names. Only offer more detailed information, such as "
+        "track duration or release dates, if explicitly requested. Confirm actions like adding "
+        "to the queue, playback controls (play, pause, volume), and recommendations concisely. "
+        "For requests involving paginated data, indicate how users can access additional "
+        "results if necessary. "
+        f"Always respond in the language '{user_language}'."
+    )
+
+
+# The tool definition holds no instance state, so every SpotifyExecutor returns this dict
+_SPOTIFY_DEFINITION: Dict[str, Any] = {
+    "type": "function",
+    "function": {
+        "name": "spotify_operations",
+        "description": (
+            "Performs Spotify-related operations. "
+            "Supports 'get_user_playlists', 'search_track', 'get_track_details', "
+            "'get_liked_songs', 'play_track', 'get_available_devices', 'pause_playback', "
+            "'skip_to_next_track', 'get_current_playback_info', 'add_track_to_queue', "
+            "'add_tracks_to_queue', 'set_volume', 'play_playlist', 'get_similar_tracks', "
+            "'get_album_details', 'get_multiple_albums', 'get_playlist', "
+            "'create_playlist', 'add_tracks_to_playlist', 'get_multiple_tracks'."
+        ),
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "description": (
+                        "The Spotify operation to perform: 'get_user_playlists', "
+                        "'search_track', 'get_track_details', 'get_liked_songs', "
+                        "'play_track', 'get_available_devices', 'pause_playback', "
+                        "'skip_to_next_track', 'get_current_playback_info', "
+                        "'add_track_to_queue', 'add_tracks_to_queue', 'set_volume',"
+                        "'play_playlist', 'get_similar_tracks', 'get_album_details', "
+                        "'get_multiple_albums', 'get_playlist', 'get_multiple_tracks'."
+                    ),
+                },
+                "query": {
+                    "type": "string",
+                    "description": "The search query, required only for 'search_track'. "
+                                   "Example: track name or artist name.",
+                },
+                "seed_track_id": {
+                    "type": "string",
+                    "description": (
+                        "The Spotify track ID to base recommendations on. Required for "
+                        "'get_similar_tracks' operation."
+                    ),
+                },
+                "track_id": {
+                    "type": "string",
+                    "description": (
+                        "The Spotify track ID, required for 'get_track_details', "
+                        "'play_track', and 'add_track_to_queue'."
+                    ),
+                },
+                "playlist_id": {
+                    "type": "string",
+                    "description": (
+                        "The Spotify playlist ID, required for 'play_playlist' operation. "
+                        "Example: Spotify URI or playlist ID."
+                    ),
+                },
+                "track_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": (
+                        "A list of Spotify track IDs to add to the playlist or queue. "
+                        "Optional for 'create_playlist' (adds tracks upon creation), "
+                        "required for 'add_tracks_to_queue' and 'add_tracks_to_playlist'. "
+                        "Also required for 'get_multiple_tracks', which fetches the details "
+                        "of all listed tracks at once instead of one 'get_track_details' "
+                        "call per track."
+                    ),
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "The number of results to return "
+                                   "(optional, default is 10). Applicable to "
+                                   "'search_track', 'get_liked_songs', "
+                                   "and 'get_similar_tracks'.",
+                },
+                "offset": {
+                    "type": "integer",
+                    "description": "The index of the first result to return, useful for "
+                                   "pagination in 'get_liked_songs'.",
+                },
+                "device_id": {
+                    "type": "string",
+                    "description": (
+                        "The ID of the device to play or control playback on (optional). "
+                        "Applicable to 'play_track', 'pause_playback', "
+                        "'skip_to_next_track', and 'add_track_to_queue'."
+                    ),
+                },
+                "volume_percent": {
+                    "type": "integer",
+                    "description": (
+                        "The target volume percentage (0 to 100) for "
+                        "'set_volume' operation."
+                    ),
+                },
+                "album_id": {
+                    "type": "string",
+                    "description": (
+                        "The Spotify album ID, required for 'get_album_details' operation. "
+                        "Example: Spotify URI or album ID."
+                    ),
+                },
+                "album_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": (
+                        "A list of Spotify album IDs to fetch multiple albums. Required "
+                        "for 'get_multiple_albums'."
+                    ),
+                },
+                "playlist_name": {
+                    "type": "string",
+                    "description": "The name for the new playlist, required "
+                                   "for 'create_playlist'.",
+                },
+                "playlist_description": {
+                    "type": "string",
+                    "description": "A description for the playlist, optional "
+                                   "for 'create_playlist'.",
+                },
+                "public": {
+                    "type": "boolean",
+                    "description": "Whether the playlist should be public or private. "
+                                   "Default is private.",
+                },
+            },
+            "required": ["operation"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+def _non_blank(ids: Optional[List[str]]) -> List[str]:
+    """Drops empty and whitespace-only IDs, which would only cost a useless API round trip."""
+    return [
+        spotify_id for spotify_id in ids or () if isinstance(spotify_id, str) and spotify_id.strip()
+    ]
+
+
+def _is_missing(value: Any) -> bool:
+    """
+    Tells whether a required parameter is absent. Blank strings and lists without a single
+    non-blank ID count as missing; 0 and False are valid values (e.g. volume 0).
+    """
+    if isinstance(value, str):
+        return not value.strip()
+    if isinstance(value, list):
+        return not _non_blank(value)
+    return value is None
+
+
 class SpotifyExecutor(ExecutorInterface):
     """
     Executor class for handling Spotify-related operations.
@@ -20,8 +205,36 @@ class SpotifyExecutor(ExecutorInterface):
 
     Attributes:
         spotify_service (SpotifyService): The service used to interact with Spotify's API.
+
+    The user's playlists are cached for a minute and track details, which never change, for an
+    hour, so repeated reads within a conversation skip the Spotify round trip. Devices are
+    always fetched fresh, since their playback state changes with every playback command.
     """
 
+    __slots__ = ("spotify_service", "_ops", "_cache")
+
+    SHORT_CACHE_TTL_SECONDS = 60
+    TRACK_CACHE_TTL_SECONDS = 3600
+    CACHE_MAX_ENTRIES = 1024
+
+    # Parameters each operation cannot run without, checked by exec before dispatching
+    _REQUIRED_PARAMETERS: Dict[str, Tuple[str, ...]] = {
+        "get_playlist": ("playlist_id",),
+        "search_track": ("query",),
+        "get_track_details": ("track_id",),
+        "play_track": ("track_id",),
+        "play_playlist": ("playlist_id",),
+        "add_track_to_queue": ("track_id",),
+        "add_tracks_to_queue": ("track_ids",),
+        "set_volume": ("volume_percent",),
+        "get_similar_tracks": ("seed_track_id",),
+        "get_album_details": ("album_id",),
+        "get_multiple_albums": ("album_ids",),
+        "get_multiple_tracks": ("track_ids",),
+        "create_playlist": ("playlist_name",),
+        "add_tracks_to_playlist": ("playlist_id", "track_ids"),
+    }
+
     def __init__(self, spotify_service):
         """
         Initializes the SpotifyExecutor with the provided SpotifyService.
@@ -30,6 +243,31 @@ class SpotifyExecutor(ExecutorInterface):
             spotify_service (SpotifyService): The service responsible for Spotify API interactions.
         """
         self.spotify_service = spotify_service
+        # (operation, id or None) -> serialized result of the cached read operations
+        self._cache = TTLCache(self.SHORT_CACHE_TTL_SECONDS, self.CACHE_MAX_ENTRIES)
+        # Operation name -> bound handler, so exec needs a single lookup per call
+        self._ops = {
+            "get_user_playlists": self._get_user_playlists,
+            "get_playlist": self._get_playlist,
+            "search_track": self._search_track,
+            "get_track_details": self._get_track_details,
+            "get_liked_songs": self._get_liked_songs,
+            "play_track": self._play_track,
+            "play_playlist": self._play_playlist,
+            "get_available_devices": self._get_available_devices,
+            "pause_playback": self._pause_playback,
+            "skip_to_next_track": self._skip_to_next_track,
+            "get_current_playback_info": self._get_current_playback_info,
+            "add_track_to_queue": self._add_track_to_queue,
+            "add_tracks_to_queue": self._add_tracks_to_queue,
+            "set_volume": self._set_volume,
+            "get_similar_tracks": self._get_similar_tracks,
+            "get_album_details": self._get_album_details,
+            "get_multiple_albums": self._get_multiple_albums,
+            "get_multiple_tracks": self._get_multiple_tracks,
+            "create_playlist": self._create_playlist,
+            "add_tracks_to_playlist": self._add_tracks_to_playlist,
+        }
 
     def get_executor_definition(self) -> Dict[str, Any]:
         """
@@ -38,132 +276,7 @@ class SpotifyExecutor(ExecutorInterface):
         Returns:
             Dict[str, Any]: The executor definition including the available Spotify operations.
         """
-        return {
-            "type": "function",
-            "function": {
-                "name": "spotify_operations",
-                "description": (
-                    "Performs Spotify-related operations. "
-                    "Supports 'get_user_playlists', 'search_track', 'get_track_details', "
-                    "'get_liked_songs', 'play_track', 'get_available_devices', 'pause_playback', "
-                    "'skip_to_next_track', 'get_current_playback_info', 'add_track_to_queue', "
-                    "'add_tracks_to_queue', 'set_volume', 'play_playlist', 'get_similar_tracks', "
-                    "'get_album_details', 'get_multiple_albums', 'get_playlist', "
-                    "'create_playlist', 'add_tracks_to_playlist'."
-                ),
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "operation": {
-                            "type": "string",
-                            "description": (
-                                "The Spotify operation to perform: 'get_user_playlists', "
-                                "'search_track', 'get_track_details', 'get_liked_songs', "
-                                "'play_track', 'get_available_devices', 'pause_playback', "
-                                "'skip_to_next_track', 'get_current_playback_info', "
-                                "'add_track_to_queue', 'add_tracks_to_queue', 'set_volume',"
-                                "'play_playlist', 'get_similar_tracks', 'get_album_details', "
-                                "'get_multiple_albums', 'get_playlist'."
-                            ),
-                        },
-                        "query": {
-                            "type": "string",
-                            "description": "The search query, required only for 'search_track'. "
-                                           "Example: track name or artist name.",
-                        },
-                        "seed_track_id": {
-                            "type": "string",
-                            "description": (
-                                "The Spotify track ID to base recommendations on. Required for "
-                                "'get_similar_tracks' operation."
-                            ),
-                        },
-                        "track_id": {
-                            "type": "string",
-                            "description": (
-                                "The Spotify track ID, required for 'get_track_details', "
-                                "'play_track', and 'add_track_to_queue'."
-                            ),
-                        },
-                        "playlist_id": {
-                            "type": "string",
-                            "description": (
-                                "The Spotify playlist ID, required for 'play_playlist' operation. "
-                                "Example: Spotify URI or playlist ID."
-                            ),
-                        },
-                        "track_ids": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": (
-                                "A list of Spotify track IDs to add to the playlist or queue. "
-                                "Optional for 'create_playlist' (adds tracks upon creation), "
-                                "required for 'add_tracks_to_queue' and 'add_tracks_to_playlist'."
-                            ),
-                        },
-                        "limit": {
-                            "type": "integer",
-                            "description": "The number of results to return "
-                                           "(optional, default is 10). Applicable to "
-                                           "'search_track', 'get_liked_songs', "
-                                           "and 'get_similar_tracks'.",
-                        },
-                        "offset": {
-                            "type": "integer",
-                            "description": "The index of the first result to return, useful for "
-                                           "pagination in 'get_liked_songs'.",
-                        },
-                        "device_id": {
-                            "type": "string",
-                            "description": (
-                                "The ID of the device to play or control playback on (optional). "
-                                "Applicable to 'play_track', 'pause_playback', "
-                                "'skip_to_next_track', and 'add_track_to_queue'."
-                            ),
-                        },
-                        "volume_percent": {
-                            "type": "integer",
-                            "description": (
-                                "The target volume percentage (0 to 100) for "
-                                "'set_volume' operation."
-                            ),
-                        },
-                        "album_id": {
-                            "type": "string",
-                            "description": (
-                                "The Spotify album ID, required for 'get_album_details' operation. "
-                                "Example: Spotify URI or album ID."
-                            ),
-                        },
-                        "album_ids": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "description": (
-                                "A list of Spotify album IDs to fetch multiple albums. Required "
-                                "for 'get_multiple_albums'."
-                            ),
-                        },
-                        "playlist_name": {
-                            "type": "string",
-                            "description": "The name for the new playlist, required "
-                                           "for 'create_playlist'.",
-                        },
-                        "playlist_description": {
-                            "type": "string",
-                            "description": "A description for the playlist, optional "
-                                           "for 'create_playlist'.",
-                        },
-                        "public": {
-                            "type": "boolean",
-                            "description": "Whether the playlist should be public or private. "
-                                           "Default is private.",
-                        },
-                    },
-                    "required": ["operation"],
-                    "additionalProperties": False,
-                },
-            },
-        }
+        return _SPOTIFY_DEFINITION
 
     def exec(self, arguments: Dict[str, Any]) -> str:
         """
@@ -176,127 +289,116 @@ class SpotifyExecutor(ExecutorInterface):
             str: The result of the Spotify operation in JSON format or an error message.
         """
         operation = arguments.get("operation")
-        result = ""
-
-        if operation == "get_user_playlists":
-            result = self._get_user_playlists()
-
-        elif operation == "get_playlist":
-            result = self._get_playlist(arguments)
-
-        elif operation == "search_track":
-            result = self._search_track(arguments)
+        handler = self._ops.get(operation)
+        if handler is None:
+            return f"Invalid operation: {operation}"
 
-        elif operation == "get_track_details":
-            result = self._get_track_details(arguments)
+        for parameter in self._REQUIRED_PARAMETERS.get(operation, ()):
+            if _is_missing(arguments.get(parameter)):
+                return f"Missing required parameter '{parameter}' for '{operation}' operation."
 
-        elif operation == "get_liked_songs":
-            result = self._get_liked_songs(arguments)
-
-        elif operation == "play_track":
-            result = self._play_track(arguments)
-
-        elif operation == "play_playlist":
-            result = self._play_playlist(arguments)
-
-        elif operation == "get_available_devices":
-            result = self._get_available_devices()
-
-        elif operation == "pause_playback":
-            result = self._pause_playback(arguments)
-
-        elif operation == "skip_to_next_track":
-            result = self._skip_to_next_track(arguments)
-
-        elif operation == "get_current_playback_info":
-            result = self._get_current_playback_info()
-
-        elif operation == "add_track_to_queue":
-            result = self._add_track_to_queue(arguments)
-
-        elif operation == "add_tracks_to_queue":
-            result = self._add_tracks_to_queue(arguments)
-
-        elif operation == "set_volume":
-            result = self._set_volume(arguments)
+        try:
+            return handler(arguments)
+        except Exception as e:
+            # Handlers without their own error message still answer with text instead of raising
+            return f"Error performing operation '{operation}': {e}"
 
-        elif operation == "get_similar_tracks":
-            result = self._get_similar_tracks(arguments)
+    async def exec_async(self, arguments: Dict[str, Any]) -> str:
+        """
+        Asynchronous variant of exec. The Spotify calls block on HTTP, so they run in a worker
+        thread and calls from several coroutines overlap their round trips.
 
-        elif operation == "get_album_details":
-            result = self._get_album_details(arguments)
+        Args:
+            arguments (Dict[str, Any]): The operation and related parameters for Spotify actions.
 
-        elif operation == "get_multiple_albums":
-            result = self._get_multiple_albums(arguments)
+        Returns:
+            str: The same result exec would return.
+        """
+        return await asyncio.to_thread(self.exec, arguments)
 
-        elif operation == "create_playlist":
-            result = self._create_playlist(arguments)
+    async def exec_batch(self, batch: Sequence[Dict[str, Any]]) -> List[str]:
+        """
+        Runs several independent Spotify operations concurrently.
 
-        elif operation == "add_tracks_to_playlist":
-            result = self._add_tracks_to_playlist(arguments)
+        Args:
+            batch (Sequence[Dict[str, Any]]): One arguments dict per operation, as for exec.
 
-        else:
-            result = f"Invalid operation: {operation}"
+        Returns:
+            List[str]: The results in the order of the batch.
+        """
+        return list(await asyncio.gather(*(self.exec_async(arguments) for arguments in batch)))
 
-        return result
+    def _invalidate_playlists(self) -> None:
+        self._cache.pop(("get_user_playlists", None))
 
-    def _get_user_playlists(self) -> str:
-        playlists = self.spotify_service.get_user_playlists()
-        return json.dumps(playlists)
+    def _get_user_playlists(self, arguments: Dict[str, Any]) -> str:
+        return self._cache.get_or_fetch(
+            ("get_user_playlists", None),
+            lambda: _dumps(self.spotify_service.get_user_playlists()),
+        )
 
     def _get_playlist(self, arguments: Dict[str, Any]) -> str:
         playlist_id = arguments.get("playlist_id")
-        if not playlist_id:
-            return "Missing required parameter 'playlist_id' for 'get_playlist' operation."
         try:
             playlist_data = self.spotify_service.get_playlist(playlist_id)
-            return json.dumps(playlist_data)
+            return _dumps(playlist_data)
         except Exception as e:
             return f"Error retrieving playlist details for ID '{playlist_id}': {e}"
 
     def _search_track(self, arguments: Dict[str, Any]) -> str:
         query = arguments.get("query")
         limit = arguments.get("limit", 10)
-        if not query:
-            return "Missing required parameter 'query' for 'search_track' operation."
         tracks = self.spotify_service.search_track(query, limit)
-        return json.dumps(tracks)
+        return _dumps(tracks)
 
     def _get_track_details(self, arguments: Dict[str, Any]) -> str:
         track_id = arguments.get("track_id")
-        if not track_id:
-            return "Missing required parameter 'track_id' for 'get_track_details' operation."
-        track_details = self.spotify_service.get_track_details(track_id)
-        return json.dumps(track_details)
+        return self._cache.get_or_fetch(
+            ("get_track_details", track_id),
+            lambda: _dumps(self.spotify_service.get_track_details(track_id)),
+            self.TRACK_CACHE_TTL_SECONDS,
+        )
 
     def _get_liked_songs(self, arguments: Dict[str, Any]) -> str:
         limit = arguments.get("limit", 10)
         offset = arguments.get("offset", 0)
         liked_songs = self.spotify_service.get_liked_songs(limit=limit, offset=offset)
-        return json.dumps(liked_songs)
+        return _dumps(liked_songs)
+
+    def iter_liked_songs(self, arguments: Dict[str, Any]) -> Iterator[str]:
+        """
+        Lazily yields the liked songs of a 'get_liked_songs' operation as one JSON array per
+        result page, instead of one string for the whole range. Only one page is fetched and
+        held at a time, so large limits do not build the full list and its JSON together.
+
+        Args:
+            arguments (Dict[str, Any]): The 'limit' and 'offset', as accepted by exec.
+
+        Returns:
+            Iterator[str]: One JSON array per page; nothing if no song matched.
+        """
+        limit = arguments.get("limit", 10)
+        offset = arguments.get("offset", 0)
+        return map(_dumps, self.spotify_service.iter_liked_songs(limit=limit, offset=offset))
 
     def _play_track(self, arguments: Dict[str, Any]) -> str:
         track_id = arguments.get("track_id")
         device_id = arguments.get("device_id")
-        if not track_id:
-            return "Missing required parameter 'track_id' for 'play_track' operation."
         playback_message = self.spotify_service.play_track(track_id, device_id=device_id)
         return playback_message
 
     def _play_playlist(self, arguments: Dict[str, Any]) -> str:
         playlist_id = arguments.get("playlist_id")
         device_id = arguments.get("device_id")
-        if not playlist_id:
-            return "Missing required parameter 'playlist_id' for 'play_playlist' operation."
         try:
             playlist_message = self.spotify_service.play_playlist(playlist_id, device_id=device_id)
             return playlist_message
         except Exception as e:
             return f"Error playing playlist with ID '{playlist_id}': {e}"
 
-    def _get_available_devices(self) -> str:
+    def _get_available_devices(self, arguments: Dict[str, Any]) -> str:
         devices = self.spotify_service.get_available_devices()
-        return json.dumps(devices)
+        return _dumps(devices)
 
     def _pause_playback(self, arguments: Dict[str, Any]) -> str:
         device_id = arguments.get("device_id")
@@ -308,31 +410,25 @@ class SpotifyExecutor(ExecutorInterface):
         skip_message = self.spotify_service.skip_to_next_track(device_id=device_id)
         return skip_message
 
-    def _get_current_playback_info(self) -> str:
+    def _get_current_playback_info(self, arguments: Dict[str, Any]) -> str:
         playback_info = self.spotify_service.get_current_playback_info()
-        return json.dumps(playback_info) if playback_info else "No active playback found."
+        return _dumps(playback_info) if playback_info else "No active playback found."
 
     def _add_track_to_queue(self, arguments: Dict[str, Any]) -> str:
         track_id = arguments.get("track_id")
         device_id = arguments.get("device_id")
-        if not track_id:
-            return "Missing required parameter 'track_id' for 'add_track_to_queue' operation."
         queue_message = self.spotify_service.add_track_to_queue(track_id, device_id=device_id)
         return queue_message
 
     def _add_tracks_to_queue(self, arguments: Dict[str, Any]) -> str:
-        track_ids = arguments.get("track_ids")
+        track_ids = _non_blank(arguments.get("track_ids"))
         device_id = arguments.get("device_id")
-        if not track_ids:
-            return "Missing required parameter 'track_ids' for 'add_tracks_to_queue' operation."
         queue_message = self.spotify_service.add_tracks_to_queue(track_ids, device_id=device_id)
         return queue_message
 
     def _set_volume(self, arguments: Dict[str, Any]) -> str:
         volume_percent = arguments.get("volume_percent")
         device_id = arguments.get("device_id")
-        if volume_percent is None:
-            return "Missing required parameter 'volume_percent' for 'set_volume' operation."
         try:
             volume_message = self.spotify_service.set_volume(volume_percent, device_id=device_id)
             return volume_message
@@ -342,38 +438,39 @@ class SpotifyExecutor(ExecutorInterface):
     def _get_similar_tracks(self, arguments: Dict[str, Any]) -> str:
         seed_track_id = arguments.get("seed_track_id")
         limit = arguments.get("limit", 10)
-        if not seed_track_id:
-            return "Missing required parameter 'seed_track_id' for 'get_similar_tracks' operation."
         similar_tracks = self.spotify_service.get_similar_tracks(seed_track_id, limit=limit)
-        return json.dumps(similar_tracks)
+        return _dumps(similar_tracks)
 
     def _get_album_details(self, arguments: Dict[str, Any]) -> str:
         album_id = arguments.get("album_id")
-        if not album_id:
-            return "Missing required parameter 'album_id' for 'get_album_details' operation."
         try:
             album_details = self.spotify_service.get_album_details(album_id)
-            return json.dumps(album_details)
+            return _dumps(album_details)
         except Exception as e:
             return f"Error fetching album details for ID '{album_id}': {e}"
 
     def _get_multiple_albums(self, arguments: Dict[str, Any]) -> str:
-        album_ids = arguments.get("album_ids")
-        if not album_ids:
-            return "Missing required parameter 'album_ids' for 'get_multiple_albums' operation."
+        album_ids = _non_blank(arguments.get("album_ids"))
         try:
             multiple_albums = self.spotify_service.get_multiple_albums(album_ids)
-            return json.dumps(multiple_albums)
+            return _dumps(multiple_albums)
         except Exception as e:
             return f"Error fetching multiple albums: {e}"
 
+    def _get_multiple_tracks(self, arguments: Dict[str, Any]) -> str:
+        track_ids = _non_blank(arguments.get("track_ids"))
+        try:
+            multiple_tracks = self.spotify_service.get_multiple_tracks(track_ids)
+            return _dumps(multiple_tracks)
+        except Exception as e:
+            return f"Error fetching multiple tracks: {e}"
+
     def _create_playlist(self, arguments: Dict[str, Any]) -> str:
-        playlist_name = arguments.get("playlist_name")
-        playlist_description = arguments.get("playlist_description", "")
-        public = arguments.get("public", False)
-        track_ids = arguments.get("track_ids")
-        if not playlist_name:
-            return "Missing required parameter 'playlist_name' for 'create_playlist' operation."
+        get = arguments.get
+        playlist_name = get("playlist_name")
+        playlist_description = get("playlist_description", "")
+        public = get("public", False)
+        track_ids = _non_blank(get("track_ids"))
         try:
             playlist = self.spotify_service.create_playlist(
                 name=playlist_name,
@@ -381,16 +478,15 @@ class SpotifyExecutor(ExecutorInterface):
                 public=public,
                 track_ids=track_ids,
             )
-            return json.dumps(playlist)
+            return _dumps(playlist)
         except Exception as e:
             return f"Error creating playlist '{playlist_name}': {e}"
+        finally:
+            self._invalidate_playlists()
 
     def _add_tracks_to_playlist(self, arguments: Dict[str, Any]) -> str:
         playlist_id = arguments.get("playlist_id")
-        track_ids = arguments.get("track_ids")
-        if not playlist_id or not track_ids:
-            return "Missing required parameters 'playlist_id' and/or 'track_ids' for " \
-                   "'add_tracks_to_playlist' operation."
+        track_ids = _non_blank(arguments.get("track_ids"))
         try:
             message = self.spotify_service.add_tracks_to_playlist(
                 playlist_id=playlist_id, track_ids=track_ids
@@ -398,7 +494,8 @@ class SpotifyExecutor(ExecutorInterface):
             return message
         except Exception as e:
             return f"Error adding tracks to playlist with ID '{playlist_id}': {e}"
-
+        finally:
+            self._invalidate_playlists()
 
     def get_result_interpreter_instructions(self, user_language="en") -> str:
         """
@@ -410,14 +507,4 @@ class SpotifyExecutor(ExecutorInterface):
         Returns:
             str: Instructions for interpreting the result.
         """
-        return (
-            "Interpret the Spotify response in a clear, user-friendly format. "
-            "Always retrieve fresh, real-time data for each request and avoid referring to any "
-            "chat history. Provide very brief and general responses, focusing on key points "
-            "like artist, album, and track names. Only offer more detailed information, such as "
-            "track duration or release dates, if explicitly requested. Confirm actions like adding "
-            "to the queue, playback controls (play, pause, volume), and recommendations concisely. "
-            "For requests involving paginated data, indicate how users can access additional "
-            "results if necessary. "
-            f"Always respond in the language '{user_language}'."
-        )
+        return _interpreter_instructions(user_language)
@@ -3,11 +3,60 @@ This module defines the WeatherExecutor class, which implements the ExecutorInte
 to perform weather-related operations such as retrieving current weather and weather forecasts.
 """
 
+import functools
 import json
 from typing import Any, Dict
 
 from ._executor_interface import ExecutorInterface
 
+# The tool definition holds no instance state, so every instance returns this dict
+_WEATHER_DEFINITION: Dict[str, Any] = {
+    "type": "function",
+    "function": {
+        "name": "weather_operations",
+        "description": (
+            "Performs weather operations. "
+            "Supports 'get_weather' for current weather and 'get_forecast' for "
+            "weather forecast."
+        ),
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "operation": {
+                    "type": "string",
+                    "description": "The weather operation to perform: "
+                                   "'get_weather', 'get_forecast'",
+                },
+                "city_name": {
+                    "type": "string",
+                    "description": "The name of the city to retrieve the weather data for.",
+                },
+                "days_ahead": {
+                    "type": "integer",
+                    "description": "Number of days ahead for the forecast "
+                                   "(optional, default is 1).",
+                },
+            },
+            "required": ["operation", "city_name"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _interpreter_instructions(user_language: str) -> str:
+    return (
+        "Interpret the weather forecast in a clear, user-friendly format. "
+        "For general questions about the forecast (e.g., whether rain is expected), provide "
+        "only a brief summary answer. If the user asks for detailed information "
+        "(like temperatures, humidity, or specific conditions for each day), include these "
+        "details as requested. Always use concise descriptions and avoid excessive details "
+        "unless explicitly requested. For multi-day forecasts, summarize key information "
+        "instead of providing full daily reports unless the user specifically asks. "
+        f"Always respond in the language '{user_language}'."
+    )
+
 
 class WeatherExecutor(ExecutorInterface):
     """
@@ -37,38 +86,7 @@ class WeatherExecutor(ExecutorInterface):
         Returns:
             Dict[str, Any]: The executor definition including the available operations.
         """
-        return {
-            "type": "function",
-            "function": {
-                "name": "weather_operations",
-                "description": (
-                    "Performs weather operations. "
-                    "Supports 'get_weather' for current weather and 'get_forecast' for "
-                    "weather forecast."
-                ),
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "operation": {
-                            "type": "string",
-                            "description": "The weather operation to perform: "
-                                           "'get_weather', 'get_forecast'",
-                        },
-                        "city_name": {
-                            "type": "string",
-                            "description": "The name of the city to retrieve the weather data for.",
-                        },
-                        "days_ahead": {
-                            "type": "integer",
-                            "description": "Number of days ahead for the forecast "
-                                           "(optional, default is 1).",
-                        },
-                    },
-                    "required": ["operation", "city_name"],
-                    "additionalProperties": False,
-                },
-            },
-        }
+        return _WEATHER_DEFINITION
 
     def exec(self, arguments: Dict[str, Any]) -> str:
         """
@@ -121,13 +139,4 @@ class WeatherExecutor(ExecutorInterface):
         Returns:
             str: Instructions for interpreting the result.
         """
-        return (
-            "Interpret the weather forecast in a clear, user-friendly format. "
-            "For general questions about the forecast (e.g., whether rain is expected), provide "
-            "only a brief summary answer. If the user asks for detailed information "
-            "(like temperatures, humidity, or specific conditions for each day), include these "
-            "details as requested. Always use concise descriptions and avoid excessive details "
-            "unless explicitly requested. For multi-day forecasts, summarize key information "
-            "instead of providing full daily reports unless the user specifically asks. "
-            f"Always respond in the language '{user_language}'."
-        )
+        return _interpreter_instructions(user_language)
@@ -3,10 +3,40 @@ This module defines the WebScraperExecutor class, which implements the ExecutorI
 to perform web scraping operations on a given URL, retrieving and parsing the HTML content.
 """
 
+import functools
 from typing import Any, Dict
 
 from ._executor_interface import ExecutorInterface
 
+# The tool definition holds no instance state, so every instance returns this dict
+_WEB_SCRAPER_DEFINITION: Dict[str, Any] = {
+    "type": "function",
+    "function": {
+        "name": "generic_web_scraping",
+        "description": "Scrapes the full HTML content from any web page.",
+        "parameters": {
+            "type": "object",
+            "properties": {
+                "url": {
+                    "type": "string",
+                    "description": "The URL of the web page to scrape.",
+                }
+            },
+            "required": ["url"],
+        },
+    },
+}
+
+
+@functools.lru_cache(maxsize=16)
+def _interpreter_instructions(user_language: str) -> str:
+    return (
+        "Analyze the user's request and provide the scraped web content as briefly as "
+        "possible. If the user request indicates specific details or sections of the page, "
+        "focus on those elements. If unsure whether further details are needed, ask the user. "
+        f"Always respond in the language '{user_language}'."
+    )
+
 
 class WebScraperExecutor(ExecutorInterface):
     """
@@ -23,23 +53,7 @@ class WebScraperExecutor(ExecutorInterface):
         self.scraper_service = scraper_service
 
     def get_executor_definition(self) -> Dict[str, Any]:
-        return {
-            "type": "function",
-            "function": {
-                "name": "generic_web_scraping",
-                "description": "Scrapes the full HTML content from any web page.",
-                "parameters": {
-                    "type": "object",
-                    "properties": {
-                        "url": {
-                            "type": "string",
-                            "description": "The URL of the web page to scrape.",
-                        }
-                    },
-                    "required": ["url"],
-                },
-            },
-        }
+        return _WEB_SCRAPER_DEFINITION
 
     def exec(self, arguments: Dict[str, Any]) -> str:
         url = arguments.get("url")
@@ -53,9 +67,4 @@ class WebScraperExecutor(ExecutorInterface):
             return f"Failed to retrieve content from {url}: {e}"
 
     def get_result_interpreter_instructions(self, user_language="en") -> str:
-        return (
-            "Analyze the user's request and provide the scraped web content as briefly as "
-            "possible. If the user request indicates specific details or sections of the page, "
-            "focus on those elements. If unsure whether further details are needed, ask the user. "
-            f"Always respond in the language '{user_language}'."
-        )
+        return _interpreter_instructions(user_language)
@@ -1,16 +1,16 @@
 # Standard library imports
 import concurrent.futures
 import datetime
+import functools
 import io
 import logging
 import os
 import queue
 import re
-import subprocess
 import threading
 import time
 import wave
-from typing import Any, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # Third-party imports
 import numpy as np
@@ -20,9 +20,27 @@ import webrtcvad
 
 # Local application imports
 from src.connectors import OpenAiConnector
-from src.entities import AudioRecordResult
+from src.entities import AudioRecordResult, AudioRingBuffer
 from src.exceptions import AudioRecordingFailed, AudioTranscriptionFailed
 
+# Patterns used while splitting streamed GPT text into speakable sentences
+_CODE_FENCE_PATTERN = re.compile(r"```")
+_SENTENCE_END_PATTERN = re.compile(r"[.!?](?=\s|$)")
+_MARKDOWN_LINK_PATTERN = re.compile(r"\[([^]]+)]\((https?://[^\s]+?)\)")
+_INLINE_CODE_PATTERN = re.compile(r"``[^`]+``")
+_PRICE_PATTERN = re.compile(r"\b\d{1,3}(?:[.,]\d{3})* (USD|EUR)\b")
+_NUMBER_PATTERN = re.compile(r"\b\d+\b")
+_DATE_PATTERN = re.compile(r"\b\d{2}\.\d{2}\.\d{4}\b")
+
+# Queued on the TTS channel queue by close() to end the TTS worker
+_STOP_TTS_WORKER = object()
+
+
+def _exceeds_amplitude(samples: np.ndarray, threshold: int) -> bool:
+    """Cheap loudness pre-check so near-silent frames can skip the VAD call."""
+    # Compare max/min instead of abs() to avoid int16 overflow on -32768
+    return bool(samples.max() >= threshold or samples.min() <= -threshold)
+
 
 class AudioService:
     """
@@ -34,6 +52,11 @@ class AudioService:
     """
 
     ALLOWED_SOUND_KEYS = {"sent", "standby"}
+    TTS_CHUNK_SIZE = 4096  # Bytes per streamed TTS chunk (2048 int16 samples)
+    TTS_SENTENCES_PER_REQUEST = 2  # Sentences grouped into one TTS request after the first
+    TTS_MAX_PARALLEL_REQUESTS = 3  # TTS requests that may be in flight at the same time
+    PLAYBACK_SAMPLE_RATE = 24000  # Sample rate of OpenAI's PCM TTS audio
+    PLAYBACK_CHANNELS = 1
 
     def __init__(
             self,
@@ -50,8 +73,24 @@ class AudioService:
         """
 
         self.vad = webrtcvad.Vad()
+        self.vad_mode: Optional[int] = None  # Mode currently configured on self.vad
+        # Capture ring buffer reused across recordings; None while a recording result holds it
+        self._capture_buffer: Optional[AudioRingBuffer] = None
         self.audio_queue: queue.Queue[np.ndarray] = queue.Queue()
-        self.transcription_lock = threading.Lock()
+        # Playback stream kept open across replies, with its (samplerate, channels)
+        self._output_stream: Optional[sd.OutputStream] = None
+        self._output_format: Optional[Tuple[int, int]] = None
+        # TTS requests run in parallel on the pool; their per-sentence audio channels are
+        # queued in reply order and relayed by the TTS worker. None marks the end of a reply
+        self._tts_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.TTS_MAX_PARALLEL_REQUESTS, thread_name_prefix="tts"
+        )
+        self._tts_queue: queue.Queue[Optional[queue.Queue[Optional[np.ndarray]]]] = (
+            queue.Queue()
+        )
+        self._tts_thread = threading.Thread(
+            target=self._tts_worker, name="tts-worker", daemon=True
+        )
         self.open_ai_connector = open_ai_connector
         self.logger = logging.getLogger(self.__class__.__name__)
         self.user_language = user_language
@@ -59,6 +98,14 @@ class AudioService:
         self.base_sound_path = os.path.join(
             "resources", "sounds", "themes", self.sound_theme
         )
+        self._tts_thread.start()
+
+        # Decode the notification sounds once so playing them needs no disk access
+        self._sound_cache: Dict[str, np.ndarray] = {}
+        for sound_key in self.ALLOWED_SOUND_KEYS:
+            file_path = os.path.join(self.base_sound_path, f"{sound_key}.wav")
+            if os.path.isfile(file_path):
+                self._sound_cache[sound_key] = self._load_sound(file_path)
 
     def play_sound(self, sound_key: str) -> None:
         """Plays a sound based on the provided key."""
@@ -72,33 +119,67 @@ class AudioService:
             self.logger.error(error_message)
             raise ValueError(error_message)  # Raise an exception for invalid sound_key
 
-        file_path = os.path.join(self.base_sound_path, f"{sound_key}.wav")
+        if sound_key not in self._sound_cache:
+            file_path = os.path.join(self.base_sound_path, f"{sound_key}.wav")
 
-        # Validate file existence
-        if not os.path.isfile(file_path):
-            error_message = f"Sound file '{file_path}' not found for key '{sound_key}'!"
-            self.logger.error(error_message)
-            raise FileNotFoundError(
-                error_message
-            )  # Raise an exception if file is missing
+            # Validate file existence
+            if not os.path.isfile(file_path):
+                error_message = f"Sound file '{file_path}' not found for key '{sound_key}'!"
+                self.logger.error(error_message)
+                raise FileNotFoundError(
+                    error_message
+                )  # Raise an exception if file is missing
+
+            self._sound_cache[sound_key] = self._load_sound(file_path)
+
+        data = self._sound_cache[sound_key]
 
         try:
-            # Play sound using ffplay
-            subprocess.run(
-                ["ffplay", "-nodisp", "-autoexit", file_path],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                check=True,
-            )
-        except subprocess.CalledProcessError as e:
+            # Go through the shared playback stream: devices without mixing (plain ALSA hw)
+            # refuse a second stream while the reply stream is still open
+            stream = self._get_output_stream(self.PLAYBACK_SAMPLE_RATE, self.PLAYBACK_CHANNELS)
+            stream.write(data)
+            # write() returns once the samples are buffered; wait until they have been heard
+            time.sleep(stream.latency)
+        except sd.PortAudioError as e:
             self.logger.error(f"Error while playing sound '{sound_key}': {e}")
+            self._close_output_stream()
             raise
 
+    @classmethod
+    def _load_sound(cls, file_path: str) -> np.ndarray:
+        """
+        Decodes a 16-bit PCM WAV file and converts it to the playback format of the TTS audio,
+        so cues and replies are played through the same output stream without reopening it.
+
+        :param file_path: Path to the WAV file.
+        :return: The samples as PLAYBACK_SAMPLE_RATE mono int16 (frames x 1).
+        :raises ValueError: If the file is not 16-bit PCM.
+        """
+        with wave.open(file_path, "rb") as wav_file:
+            if wav_file.getsampwidth() != 2:
+                raise ValueError(f"Sound file '{file_path}' is not 16-bit PCM.")
+            channels = wav_file.getnchannels()
+            sample_rate = wav_file.getframerate()
+            frames = wav_file.readframes(wav_file.getnframes())
+
+        # Downmix to mono in floating point, so summing channels cannot overflow int16
+        samples = np.frombuffer(frames, dtype=np.int16).reshape(-1, channels).mean(axis=1)
+        if sample_rate != cls.PLAYBACK_SAMPLE_RATE:
+            # Linear interpolation is good enough for short notification cues
+            target_count = round(len(samples) * cls.PLAYBACK_SAMPLE_RATE / sample_rate)
+            positions = np.arange(target_count) * (sample_rate / cls.PLAYBACK_SAMPLE_RATE)
+            samples = np.interp(positions, np.arange(len(samples)), samples)
+
+        return np.round(samples).astype(np.int16).reshape(-1, cls.PLAYBACK_CHANNELS)
+
     def record(
             self,
             sample_rate: int = 16000,
             frame_duration_ms: int = 30,
             max_silence_duration: float = 1.0,
+            max_recording_duration: float = 30.0,
+            silence_amplitude: int = 300,
     ) -> AudioRecordResult:
         """
         Records audio dynamically, starting only when speech is detected,
@@ -112,69 +193,138 @@ class AudioService:
                     (must be 10, 20, or 30, default: 30 ms).
         :param max_silence_duration: Duration in seconds after which recording stops when no
                     speech is detected (default: 1 second).
+        :param max_recording_duration: Upper bound in seconds for a single recording; it sizes
+                    the preallocated capture buffer (default: 30 seconds).
+        :param silence_amplitude: Peak sample amplitude below which a frame is treated as
+                    silence without asking the VAD (default: 300, 0 disables the check).
         :return: AudioRecordResult containing success state and the recorded audio data.
         """
 
-        audio_frames = []
+        frame_count = 0
         silence_duration = 0
         recording_started = False
         frame_size = int(sample_rate * frame_duration_ms / 1000)
 
-        # Using a context manager to ensure resources are properly managed
-        with sd.InputStream(
-                samplerate=sample_rate, channels=1, dtype="int16"
-        ) as stream:
-            self.logger.info("Audio stream started.")
-            start_time = time.time()  # Track the start time to handle silence timeouts
-
-            try:
-                while True:
-                    audio_frame, _ = stream.read(frame_size)
-                    audio_frames.append(audio_frame)
-
-                    # Detect speech in the current audio frame
-                    if self.is_speech(audio_frame, sample_rate):
-                        silence_duration = 0  # Reset silence if speech is detected
-                        if not recording_started:
-                            self.logger.info("Speech detected, starting recording...")
-                            recording_started = True
-
-                    # Handle timeout when no speech is detected
-                    if not recording_started and (time.time() - start_time) > 3:
-                        self.logger.info("No speech detected for 3 seconds, timeout.")
-                        return AudioRecordResult(success=False, silence_timeout=True)
-
-                    # Stop recording after 1 second of silence
-                    if recording_started:
-                        if silence_duration > max_silence_duration:
-                            self.logger.info("Silence detected, stopping recording.")
-                            break  # Stop the recording
-
-                        silence_duration += (
-                                frame_duration_ms / 1000
-                        )  # Increase silence duration
-
-            finally:
-                self.logger.info("Audio stream stopped.")
-
-        # Handle the case where no audio was captured
-        if not audio_frames:
-            self.logger.error("Recording started but no audio was captured.")
-            raise AudioRecordingFailed("Recording started but no audio was captured.")
-
-        # Recording was successful, concatenate the frames
-        audio_array = np.concatenate(audio_frames, axis=0)
-        self.logger.info(
-            f"Audio recording complete with {len(audio_frames)} frames captured."
-        )
+        # Reuse the capture ring buffer of earlier recordings; frames are copied into it in place
+        audio_buffer = self._acquire_capture_buffer(int(sample_rate * max_recording_duration))
+        buffer_handed_out = False
+        try:
+            # PortAudio's audio thread delivers one VAD frame per callback into this queue,
+            # so capture keeps running even while this thread is busy with the VAD
+            captured_frames: queue.Queue[bytes] = queue.Queue()
+
+            def on_audio_frame(indata, frames, time_info, status) -> None:
+                # Raw streams hand out PCM bytes, which webrtcvad consumes as-is
+                captured_frames.put(bytes(indata))
+
+            # Using a context manager to ensure resources are properly managed
+            with sd.RawInputStream(
+                    samplerate=sample_rate,
+                    channels=1,
+                    dtype="int16",
+                    blocksize=frame_size,
+                    callback=on_audio_frame,
+            ):
+                self.logger.info("Audio stream started.")
+                start_time = time.time()  # Track the start time to handle silence timeouts
+
+                try:
+                    while True:
+                        try:
+                            audio_frame = captured_frames.get(timeout=1.0)
+                        except queue.Empty:
+                            error_message = "No audio received from the input device."
+                            self.logger.error(error_message)
+                            raise AudioRecordingFailed(error_message)
+
+                        # Stop once the preallocated buffer is full
+                        if len(audio_buffer) + frame_size > audio_buffer.capacity:
+                            self.logger.info(
+                                f"Maximum recording duration of {max_recording_duration}s "
+                                f"reached, stopping recording."
+                            )
+                            break
+
+                        samples = np.frombuffer(audio_frame, dtype=np.int16)
+                        audio_buffer.write(samples)
+                        frame_count += 1
+
+                        # Detect speech in the current audio frame, skipping the VAD for
+                        # frames that are too quiet to contain speech
+                        if _exceeds_amplitude(samples, silence_amplitude) and self.is_speech(
+                                audio_frame, sample_rate
+                        ):
+                            silence_duration = 0  # Reset silence if speech is detected
+                            if not recording_started:
+                                self.logger.info("Speech detected, starting recording...")
+                                recording_started = True
+
+                        # Handle timeout when no speech is detected
+                        if not recording_started and (time.time() - start_time) > 3:
+                            self.logger.info("No speech detected for 3 seconds, timeout.")
+                            return AudioRecordResult(success=False, silence_timeout=True)
+
+                        # Stop recording after 1 second of silence
+                        if recording_started:
+                            if silence_duration > max_silence_duration:
+                                self.logger.info("Silence detected, stopping recording.")
+                                break  # Stop the recording
+
+                            silence_duration += (
+                                    frame_duration_ms / 1000
+                            )  # Increase silence duration
+
+                finally:
+                    self.logger.info("Audio stream stopped.")
+
+            # Handle the case where no audio was captured
+            if not len(audio_buffer):
+                self.logger.error("Recording started but no audio was captured.")
+                raise AudioRecordingFailed("Recording started but no audio was captured.")
+
+            # Recording was successful; hand out a read-only view of the captured samples
+            # instead of copying them. The buffer returns to the service on release().
+            audio_array = audio_buffer.view()
+            self.logger.info(
+                f"Audio recording complete with {frame_count} frames captured."
+            )
 
-        return AudioRecordResult(success=True, data=audio_array)
+            buffer_handed_out = True
+            return AudioRecordResult(
+                success=True,
+                data=audio_array,
+                view=True,
+                release=functools.partial(self._release_capture_buffer, audio_buffer),
+            )
+        finally:
+            # Failed or timed-out recordings give the buffer back right away
+            if not buffer_handed_out:
+                self._release_capture_buffer(audio_buffer)
 
-    def is_speech(self, frame: np.ndarray, sample_rate: int, vad_mode: int = 3) -> bool:
+    def _acquire_capture_buffer(self, num_samples: int) -> AudioRingBuffer:
+        """
+        Takes the reusable capture ring buffer, or allocates a new one if it is too small or
+        still held by an unreleased recording result.
+        """
+        audio_buffer = self._capture_buffer
+        self._capture_buffer = None
+        if audio_buffer is None or audio_buffer.capacity < num_samples:
+            audio_buffer = AudioRingBuffer(num_samples)
+        return audio_buffer
+
+    def _release_capture_buffer(self, audio_buffer: AudioRingBuffer) -> None:
+        """Empties a capture ring buffer and makes it available to the next recording."""
+        audio_buffer.release()
+        self._capture_buffer = audio_buffer
+
+    def is_speech(
+            self, frame: Union[bytes, np.ndarray], sample_rate: int, vad_mode: int = 3
+    ) -> bool:
         """
         Check if the audio frame contains speech using webrtcvad.
 
-        :param frame: The audio frame (NumPy array) to be checked for speech.
+        :param frame: The audio frame (raw 16-bit PCM bytes or a NumPy array)
+                    to be checked for speech.
         :param sample_rate: The sample rate of the audio in Hz
                     (must be 8000, 16000, 32000, or 48000).
         :param vad_mode: Sensitivity of the VAD (Voice Activity Detection).
@@ -191,9 +341,14 @@ class AudioService:
             raise ValueError(f"Invalid vad_mode: {vad_mode}. Must be between 0 and 3.")
 
         try:
-            self.vad.set_mode(vad_mode)
-            # Convert the frame to bytes because webrtcvad expects raw PCM bytes
-            is_speech_detected = self.vad.is_speech(frame.tobytes(), sample_rate)
+            # Reconfigure the shared VAD instance only when the requested mode changes
+            if vad_mode != self.vad_mode:
+                self.vad.set_mode(vad_mode)
+                self.vad_mode = vad_mode
+            # webrtcvad expects raw PCM bytes; only NumPy frames need converting
+            if isinstance(frame, np.ndarray):
+                frame = frame.tobytes()
+            is_speech_detected = self.vad.is_speech(frame, sample_rate)
             return is_speech_detected
         except Exception as e:
             self.logger.error(f"Error in is_speech detection: {e}")
@@ -262,49 +417,148 @@ class AudioService:
             self.logger.error(f"An error occurred during transcription: {e}")
             raise AudioTranscriptionFailed(f"Transcription failed due to: {e}")
 
-    def process_speech(self, text: str) -> None:
+    def process_speech(
+            self, text: str, output_queue: Optional["queue.Queue[Optional[np.ndarray]]"] = None
+    ) -> None:
         """
         Converts the given text into audio using OpenAI's text-to-speech (TTS) API
         and stores the resulting audio data in the audio queue.
 
         :param text: The text to be converted into speech.
+        :param output_queue: Optional per-sentence channel that receives the audio chunks
+                    instead of the audio queue. Used to synthesize sentences in parallel while
+                    keeping their playback order.
         :raises: Raises an exception if the TTS process fails.
         """
         self.logger.info(
             f"Sending sentence to OpenAI API to convert to audio "
             f"(text length: {len(text)} characters)."
         )
+        target_queue = self.audio_queue if output_queue is None else output_queue
 
         try:
-            with self.transcription_lock:
-                # Request OpenAI TTS API to convert the text to audio
-                with self.open_ai_connector.client.audio.speech.with_streaming_response.create(
-                        model="tts-1", voice="nova", input=text, response_format="pcm"
-                ) as response_audio:
-                    self.logger.info("Audio of sentence received from OpenAI API.")
-
-                    # Convert the audio response to a NumPy array
-                    audio_data: ndarray = np.frombuffer(response_audio.read(), dtype=np.int16)
-                    self.logger.info(
-                        f"Received audio data (size: {audio_data.size} samples)."
-                    )
-
-                    # Store the audio data in the queue
-                    self.audio_queue.put(audio_data)
-                    self.logger.info("Audio processing completed and added to queue.")
+            # Request OpenAI TTS API to convert the text to audio
+            with self.open_ai_connector.client.audio.speech.with_streaming_response.create(
+                    model="tts-1", voice="nova", input=text, response_format="pcm"
+            ) as response_audio:
+                self.logger.info("Audio of sentence received from OpenAI API.")
+
+                # Queue the audio chunk by chunk so playback starts while
+                # the rest of the sentence is still downloading
+                total_samples = 0
+                for chunk in response_audio.iter_bytes(self.TTS_CHUNK_SIZE):
+                    audio_data: ndarray = np.frombuffer(chunk, dtype=np.int16)
+                    target_queue.put(audio_data)
+                    total_samples += audio_data.size
+
+                self.logger.info(
+                    f"Audio processing completed and added to queue "
+                    f"(size: {total_samples} samples)."
+                )
 
         except Exception as e:
             # Log the error with more details
             self.logger.error(f"Error occurred during speech processing: {e}")
-            # Add an empty numpy array as an end signal
-            self.audio_queue.put(np.array([], dtype=np.int16))
+            if output_queue is None:
+                # Add an empty numpy array as an end signal
+                self.audio_queue.put(np.array([], dtype=np.int16))
             raise AudioTranscriptionFailed(f"Failed to process speech due to: {e}")
 
-    def play_audio(self, samplerate: int = 24000, channels: int = 1) -> None:
+    def _synthesize_into(
+            self, text: str, channel: "queue.Queue[Optional[np.ndarray]]"
+    ) -> None:
+        """
+        Runs process_speech for one sentence group on the TTS pool and closes its channel
+        with None, whether the request succeeded or not.
+        """
+        try:
+            self.process_speech(text, channel)
+        except AudioTranscriptionFailed as e:
+            # process_speech already logged the failure; the sentence is skipped
+            self.logger.debug(f"Skipping failed TTS request: {e}")
+        finally:
+            channel.put(None)
+
+    def _tts_worker(self) -> None:
+        """
+        Relays synthesized audio to the audio queue for as long as the service lives.
+        Channels are drained strictly in the order their sentences were queued, so parallel
+        TTS requests never reorder playback. An end marker (None) is turned into the stop
+        signal for play_audio once every channel queued before it has been relayed.
+        """
+        while True:
+            channel = self._tts_queue.get()
+            if channel is _STOP_TTS_WORKER:
+                return
+            if channel is None:
+                self.stop_audio()
+                continue
+
+            # Forward chunks as they arrive until the sentence's channel is closed
+            while (audio_data := channel.get()) is not None:
+                self.audio_queue.put(audio_data)
+
+    def _queue_speech(self, text: str) -> None:
+        """Starts synthesizing text on the TTS pool and reserves its place in playback order."""
+        channel: queue.Queue[Optional[np.ndarray]] = queue.Queue()
+        self._tts_queue.put(channel)
+        future = self._tts_pool.submit(self._synthesize_into, text, channel)
+        # Requests cancelled by close() never run, so their channel is closed here instead
+        future.add_done_callback(lambda done: done.cancelled() and channel.put(None))
+
+    def _get_output_stream(self, samplerate: int, channels: int) -> sd.OutputStream:
+        """
+        Returns the started playback stream for the given format, opening it on first use.
+        The device stays open between replies, so only a format change reopens it.
+
+        :param samplerate: The sample rate of the stream.
+        :param channels: The number of audio channels of the stream.
+        :return: A started sd.OutputStream.
+        """
+        if self._output_stream is not None and self._output_format != (samplerate, channels):
+            self._close_output_stream()
+
+        if self._output_stream is None:
+            self._output_stream = sd.OutputStream(
+                samplerate=samplerate, channels=channels, dtype="int16", latency="low"
+            )
+            self._output_stream.start()
+            self._output_format = (samplerate, channels)
+            self.logger.info("Audio output stream opened.")
+
+        return self._output_stream
+
+    def _close_output_stream(self) -> None:
+        """Stops and closes the persistent playback stream, if one is open."""
+        if self._output_stream is None:
+            return
+
+        try:
+            # stop() plays out the buffered audio before the device is released
+            self._output_stream.stop()
+            self._output_stream.close()
+        finally:
+            self._output_stream = None
+            self._output_format = None
+            self.logger.info("Audio output stream closed.")
+
+    def close(self) -> None:
+        """
+        Stops the TTS pool and worker and releases the audio output device. Call this when the
+        service is no longer needed.
+        """
+        self._tts_pool.shutdown(cancel_futures=True)
+        self._tts_queue.put(_STOP_TTS_WORKER)
+        self._tts_thread.join()
+        self._close_output_stream()
+
+    def play_audio(
+            self, samplerate: int = PLAYBACK_SAMPLE_RATE, channels: int = PLAYBACK_CHANNELS
+    ) -> None:
         """
         Continuously plays audio data from the queue using the specified sample
         rate and channel count. Playback ends when an empty audio signal (size 0) is
-        received in the queue.
+        received in the queue. The output stream is kept open for the next playback.
 
         :param samplerate: The sample rate to use for audio playback (default: 24000 Hz).
         :param channels: The number of audio channels (default: 1).
@@ -314,34 +568,31 @@ class AudioService:
         )
 
         try:
-            with sd.OutputStream(
-                    samplerate=samplerate, channels=channels, dtype="int16"
-            ) as stream_audio:
-                self.logger.info("Audio stream started.")
+            stream_audio = self._get_output_stream(samplerate, channels)
 
-                while True:
-                    # Blocks until audio data is available in the queue
-                    audio_data = self.audio_queue.get()
-
-                    # Check for the end signal (empty array)
-                    if audio_data.size == 0:
-                        self.logger.info(
-                            "Received end signal, stopping audio playback."
-                        )
-                        break
-
-                    # Write audio data to the output stream
-                    stream_audio.write(audio_data)
-                    self.logger.debug(
-                        f"Played audio chunk of size {audio_data.size} samples."
-                    )
+            while True:
+                # Blocks until audio data is available in the queue
+                audio_data = self.audio_queue.get()
+
+                # Check for the end signal (empty array)
+                if audio_data.size == 0:
+                    self.logger.info("Received end signal, stopping audio playback.")
+                    break
+
+                # Write audio data to the output stream
+                stream_audio.write(audio_data)
+                self.logger.debug(f"Played audio chunk of size {audio_data.size} samples.")
 
         except Exception as e:
             self.logger.error(f"Error occurred during audio playback: {e}")
+            # Drop a broken stream so the next playback reopens the device
+            try:
+                self._close_output_stream()
+            except Exception as close_error:
+                self.logger.error(f"Error while closing audio output stream: {close_error}")
 
         finally:
-            self.logger.info("Audio playback finished and stream closed.")
-            sd.wait()  # Ensure all audio buffers are played
+            self.logger.info("Audio playback finished.")
 
     def collect_until_sentence_end(
             self, text_buffer: str, in_code_block: bool = False
@@ -367,12 +618,12 @@ class AudioService:
         # If inside a code block, skip sentence detection
         if in_code_block:
             # Check if the code block closes within the current buffer
-            if re.search(r"```", processed_text):
+            if _CODE_FENCE_PATTERN.search(processed_text):
                 in_code_block = False  # End of code block
             return "", processed_text, in_code_block
 
         # Regex to detect sentence-ending punctuation followed by a space or end of text
-        match = re.search(r"[.!?](?=\s|$)", processed_text)
+        match = _SENTENCE_END_PATTERN.search(processed_text)
 
         if match:
             # Return the sentence and the remaining text
@@ -398,15 +649,13 @@ class AudioService:
                 code block.
         """
         # Handle links in Markdown format [Text](URL)
-        text = re.sub(
-            r"\[([^]]+)]\((https?://[^\s]+?)\)",
-            r"\1 (Den Link findest du in der Textausgabe.)",
-            text,
+        text = _MARKDOWN_LINK_PATTERN.sub(
+            r"\1 (Den Link findest du in der Textausgabe.)", text
         )
 
         # Check for the start or end of a code block with triple backticks ```
         if in_code_block:
-            end_match = re.search(r"```", text)
+            end_match = _CODE_FENCE_PATTERN.search(text)
             if end_match:
                 text = (
                         "Den Quellcode findest du in der Textausgabe."
@@ -416,14 +665,14 @@ class AudioService:
             else:
                 text = "Den Quellcode findest du in der Textausgabe."
         else:
-            start_match = re.search(r"```", text)
+            start_match = _CODE_FENCE_PATTERN.search(text)
             if start_match:
-                end_match = re.search(r"```", text[start_match.end():])
+                end_match = _CODE_FENCE_PATTERN.search(text, start_match.end())
                 if end_match:
                     text = (
                             text[: start_match.start()]
                             + "Den Quellcode findest du in der Textausgabe."
-                            + text[start_match.end() + end_match.end():]
+                            + text[end_match.end():]
                     )
                 else:
                     text = (
@@ -434,8 +683,8 @@ class AudioService:
 
         # Replace inline code with double backticks (but ignore single backticks)
         if not in_code_block:
-            text = re.sub(
-                r"``[^`]+``", "Den Quellcode findest du in der Textausgabe.", text
+            text = _INLINE_CODE_PATTERN.sub(
+                "Den Quellcode findest du in der Textausgabe.", text
             )
 
         # Skip numbers in prices like "66.842 USD" to leave them as is
@@ -456,7 +705,7 @@ class AudioService:
         :return: The modified text with prices preserved.
         """
         # Match prices with pattern 'X.XXX USD' or 'XX,XXX EUR' and keep them unchanged
-        return re.sub(r"\b\d{1,3}(?:[.,]\d{3})* (USD|EUR)\b", lambda m: m.group(), text)
+        return _PRICE_PATTERN.sub(lambda m: m.group(), text)
 
     def convert_numbers_to_words(self, text: str) -> str:
         """
@@ -485,7 +734,7 @@ class AudioService:
             )
 
         # Replace isolated numbers
-        return re.sub(r"\b\d+\b", number_to_word, text)
+        return _NUMBER_PATTERN.sub(number_to_word, text)
 
     def convert_dates_to_words(self, text: str) -> str:
         """
@@ -508,16 +757,19 @@ class AudioService:
                 return date_str  # If parsing fails, return the original string
 
         # Replace dates in the format DD.MM.YYYY
-        return re.sub(r"\b\d{2}\.\d{2}\.\d{4}\b", date_to_words, text)
+        return _DATE_PATTERN.sub(date_to_words, text)
 
     def play_stream_audio(
-            self, stream: Any, samplerate: int = 24000, channels: int = 1
+            self,
+            stream: Any,
+            samplerate: int = PLAYBACK_SAMPLE_RATE,
+            channels: int = PLAYBACK_CHANNELS,
     ) -> None:
         """
         Stream GPT responses, convert them into speech, and play the audio in a separate thread.
-        This method handles streaming text, detecting sentence boundaries, and converting
-        the text to audio using the process_speech method. It also manages the audio playback
-        by running an audio thread and sending stop signals when finished.
+        This method handles streaming text, detecting sentence boundaries, and handing the
+        sentences to the TTS pool, which converts them with process_speech in parallel. It also
+        manages the audio playback by running an audio thread until the TTS worker stops it.
 
         :param stream: The GPT response stream to be processed.
         :param samplerate: The sample rate for the audio playback (default: 24000 Hz).
@@ -531,52 +783,56 @@ class AudioService:
         )
         audio_thread.start()
 
-        # Initialize buffers for processing the stream
+        # Initialize the buffer for sentence detection and the sentences awaiting TTS
         text_buffer: str = ""
-        assistant_reply: str = ""
+        pending_sentences: List[str] = []
+        first_request_sent = False
 
         try:
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future: Optional[concurrent.futures.Future] = None
-                in_code_block = False
-                for chunk in stream:
-                    if chunk.choices[0].delta.content is not None:
-                        content: str = chunk.choices[0].delta.content
-
-                        assistant_reply += content
-                        text_buffer += content
-
-                        # Sentence detection and start speech processing
-                        sentence, remaining_text, in_code_block = (
-                            self.collect_until_sentence_end(text_buffer, in_code_block)
-                        )
-                        if sentence:
+            in_code_block = False
+            for chunk in stream:
+                if chunk.choices[0].delta.content is not None:
+                    content: str = chunk.choices[0].delta.content
+
+                    text_buffer += content
+
+                    # Sentence detection and start speech processing
+                    sentence, remaining_text, in_code_block = (
+                        self.collect_until_sentence_end(text_buffer, in_code_block)
+                    )
+                    if sentence:
+                        self.logger.debug(f"Detected sentence: '{sentence}'.")
+                        pending_sentences.append(sentence)
+                        text_buffer = remaining_text
+
+                        # Speak the first sentence right away to keep the reply
+                        # snappy, then group sentences to save TTS round trips
+                        if (
+                                not first_request_sent
+                                or len(pending_sentences) >= self.TTS_SENTENCES_PER_REQUEST
+                        ):
                             self.logger.debug(
-                                f"Detected sentence: '{sentence}'. "
-                                f"Submitting for speech processing."
+                                f"Queueing {len(pending_sentences)} sentence(s) "
+                                f"for speech processing."
                             )
-                            future = executor.submit(self.process_speech, sentence)
-                            text_buffer = remaining_text
-
-                # Process remaining text (if no complete sentence)
-                if text_buffer:
-                    self.logger.debug(f"Processing remaining text: '{text_buffer}'")
-                    future = executor.submit(self.process_speech, text_buffer)
-
-                # Ensure that the last submitted future is completed
-                if future:
-                    self.logger.debug(
-                        "Waiting for the last speech processing task to finish."
-                    )
-                    future.result()
+                            self._queue_speech(" ".join(pending_sentences))
+                            pending_sentences = []
+                            first_request_sent = True
+
+            # Process remaining text (if no complete sentence)
+            if text_buffer:
+                self.logger.debug(f"Processing remaining text: '{text_buffer}'")
+                pending_sentences.append(text_buffer)
+            if pending_sentences:
+                self._queue_speech(" ".join(pending_sentences))
 
         except Exception as e:
             self.logger.error(f"Error occurred while processing stream: {e}")
 
         finally:
-            # Signal the end of the audio stream and stop the audio thread
-            self.logger.info("Sending stop signal to audio thread.")
-            self.stop_audio()
+            # The TTS worker stops the audio thread once the queued sentences are spoken
+            self.logger.info("Queueing end of reply for the TTS worker.")
+            self._tts_queue.put(None)
 
             # Wait until the audio thread finishes
             audio_thread.join()
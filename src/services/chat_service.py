@@ -316,8 +316,7 @@ class ChatService:
         Returns:
             str: The complete text that was printed.
         """
-        text_buffer: str = ""
-        assistant_reply: str = ""
+        reply_parts: List[str] = []
 
         for chunk in stream:
             if chunk.choices[0].delta.content is not None:
@@ -325,9 +324,9 @@ class ChatService:
 
                 self.format_and_print_content(content)
 
-                assistant_reply += content
-                text_buffer += content
+                reply_parts.append(content)
 
+        assistant_reply: str = "".join(reply_parts)
         print()  # adds linebreak at the end
         self.logger.debug(
             "Completed stream output. Total characters: %s", len(assistant_reply)
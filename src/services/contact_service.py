@@ -1,6 +1,8 @@
 # Standard library imports
 import logging
 import os
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import vobject
 
@@ -12,7 +14,17 @@ class ContactService:
 
         self.logger = logging.getLogger(self.__class__.__name__)
 
-    def list(self, search_string: str = ""):
+        # Parsed address book together with the (mtime, size) of the file it was read from.
+        # The lock makes concurrent searches share a single parse instead of each reading
+        # the file on its own.
+        self._contacts: Optional[List[Tuple[Dict[str, Any], List[str]]]] = None
+        self._contacts_stamp: Optional[Tuple[int, int]] = None
+        # Maps every two-character substring of a lower-cased name or email to the ascending
+        # positions in _contacts that contain it, so searches only check likely matches
+        self._bigrams: Dict[str, List[int]] = {}
+        self._contacts_lock = threading.Lock()
+
+    def list(self, search_string: str = "") -> List[Dict[str, Any]]:
         """
         Reads the contacts from the vCard file and returns a list of contacts,
         optionally filtered by a search string.
@@ -23,29 +35,89 @@ class ContactService:
         Returns:
             list: A list of dictionaries, each representing a contact.
         """
-        if not os.path.exists(self.contacts_file_path):
-            self.logger.error(f"Contacts file not found at {self.contacts_file_path}")
-            return []
+        return list(self.iter(search_string))
+
+    def iter(self, search_string: str = "") -> Iterator[Dict[str, Any]]:
+        """
+        Yields the contacts from the vCard file, optionally filtered by a search string.
+        The file is only parsed again when its modification time or size changed; the yielded
+        dictionaries are shared between calls and must not be modified.
+
+        Args:
+            search_string (str): The string to filter contacts by name or email.
+
+        Yields:
+            dict: A dictionary representing a contact. Besides the 'emails' and 'phones' lists
+            it holds their comma-separated forms as 'emails_str' and 'phones_str'.
+        """
+        contacts, bigrams = self._load_contacts()
 
+        # Normalise the search string once instead of for every contact and email
+        needle = search_string.strip().lower()
+
+        if len(needle) < 2:
+            candidates = range(len(contacts))
+        else:
+            # Every match contains all bigrams of the needle, so the rarest one bounds the scan
+            candidates = min(
+                (bigrams.get(needle[i:i + 2], ()) for i in range(len(needle) - 1)), key=len
+            )
+
+        for position in candidates:
+            contact, haystacks = contacts[position]
+            # Check if the contact matches the search string (if provided)
+            if any(needle in haystack for haystack in haystacks):
+                yield contact
+
+    def _load_contacts(
+        self,
+    ) -> Tuple[List[Tuple[Dict[str, Any], List[str]]], Dict[str, List[int]]]:
+        """
+        Returns the parsed contacts with their lower-cased name and emails, and the bigram
+        index over them, parsing the vCard file only if it changed since the last call.
+        Errors are logged and yield no contacts.
+        """
         try:
-            with open(self.contacts_file_path, "r") as f:
-                vcard_data = f.read()
+            stat = os.stat(self.contacts_file_path)
+        except FileNotFoundError:
+            self.logger.error(f"Contacts file not found at {self.contacts_file_path}")
+            return [], {}
+
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._contacts_lock:
+            if self._contacts is not None and self._contacts_stamp == stamp:
+                return self._contacts, self._bigrams
 
-            vcards = vobject.readComponents(vcard_data)
             contacts = []
-            for vcard in vcards:
-                name = vcard.fn.value if hasattr(vcard, "fn") else "Unknown"
-                emails = [email.value for email in getattr(vcard, "email_list", [])]
-                phones = [tel.value for tel in getattr(vcard, "tel_list", [])]
-
-                # Check if the contact matches the search string (if provided)
-                if search_string.lower() in name.lower() or any(
-                    search_string.lower() in email.lower() for email in emails
-                ):
-                    contact = {"name": name, "emails": emails, "phones": phones}
-                    contacts.append(contact)
-
-            return contacts
-        except Exception as e:
-            self.logger.error(f"Error reading contacts: {e}")
-            return []
+            try:
+                with open(self.contacts_file_path, "r") as f:
+                    for vcard in vobject.readComponents(f):
+                        name = vcard.fn.value if hasattr(vcard, "fn") else "Unknown"
+                        emails = [email.value for email in getattr(vcard, "email_list", [])]
+                        phones = [tel.value for tel in getattr(vcard, "tel_list", [])]
+                        haystacks = [name.lower()] + [email.lower() for email in emails]
+                        # The joined forms are what the executor prints, so build them once here
+                        contact = {
+                            "name": name,
+                            "emails": emails,
+                            "phones": phones,
+                            "emails_str": ", ".join(emails),
+                            "phones_str": ", ".join(phones),
+                        }
+                        contacts.append((contact, haystacks))
+            except Exception as e:
+                self.logger.error(f"Error reading contacts: {e}")
+                return [], {}
+
+            bigrams: Dict[str, List[int]] = {}
+            for position, (_, haystacks) in enumerate(contacts):
+                seen = set()
+                for haystack in haystacks:
+                    seen.update(haystack[i:i + 2] for i in range(len(haystack) - 1))
+                for bigram in seen:
+                    bigrams.setdefault(bigram, []).append(position)
+
+            self._contacts = contacts
+            self._bigrams = bigrams
+            self._contacts_stamp = stamp
+            return contacts, bigrams
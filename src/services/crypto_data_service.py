@@ -2,6 +2,7 @@ import logging
 from typing import List
 
 from src.connectors import CoinGeckoConnector
+from src.entities import RequestCoalescer
 
 
 class CryptoDataService:
@@ -27,6 +28,10 @@ class CryptoDataService:
 
         self.logger = logging.getLogger(self.__class__.__name__)
 
+        # API calls that are currently running, keyed by operation and arguments.
+        # Identical requests from concurrent chat turns wait on these instead of calling again.
+        self._inflight = RequestCoalescer()
+
     def get_ohlc(self, coin_id: str, vs_currency: str = "usd", days: int = 7):
         """
         Fetch OHLC data for a specific cryptocurrency.
@@ -40,8 +45,11 @@ class CryptoDataService:
             List: A list of OHLC data where each entry contains [timestamp, open, high, low, close].
         """
         # Abrufen der OHLC-Daten über den Connector
-        return self.connector.client.get_coin_ohlc_by_id(
-            id=coin_id, vs_currency=vs_currency, days=days
+        return self._inflight.run(
+            ("ohlc", coin_id, vs_currency, days),
+            lambda: self.connector.client.get_coin_ohlc_by_id(
+                id=coin_id, vs_currency=vs_currency, days=days
+            ),
         )
 
     def get_market_data(self, coin_id: str, vs_currency: str = "usd") -> dict:
@@ -58,7 +66,10 @@ class CryptoDataService:
         """
         try:
             # Abrufen der Marktdaten über den CoinGecko-Connector
-            data = self.connector.client.get_coin_by_id(id=coin_id, vs_currency=vs_currency)
+            data = self._inflight.run(
+                ("market", coin_id, vs_currency),
+                lambda: self.connector.client.get_coin_by_id(id=coin_id, vs_currency=vs_currency),
+            )
 
             # Extrahieren der relevanten Daten aus der API-Antwort
             market_data = {
@@ -69,4 +80,4 @@ class CryptoDataService:
             return market_data
         except Exception as e:
             self.logger.error(f"Error fetching market data for {coin_id}: {e}")
-            return {}
\ No newline at end of file
+            return {}
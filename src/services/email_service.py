@@ -14,6 +14,9 @@ from src.exceptions import EmailDeletionError, EmailListingError, EmailNotFound
 
 
 class EmailService:
+    # Listings with bodies are limited to this many of the most recent matching emails
+    MAX_LISTED_BODIES = 20
+
     def __init__(
         self,
         smtp_connector: SmtpConnector,
@@ -113,6 +116,7 @@ class EmailService:
         unread_only: bool = False,
         date_from: Optional[datetime] = None,
         date_to: Optional[datetime] = None,
+        include_body: bool = False,
     ) -> List[Dict[str, str]]:
         """
         Fetches a list of emails with optional filters applied.
@@ -124,12 +128,15 @@ class EmailService:
             unread_only (bool): If True, only return unread emails.
             date_from (Optional[datetime]): Start date for filtering emails.
             date_to (Optional[datetime]): End date for filtering emails.
+            include_body (bool): If True, each dictionary also holds the email's body text under
+                'body', fetched in the same IMAP request as the headers without marking the
+                email as read. Only the MAX_LISTED_BODIES most recent matching emails are listed.
 
         Returns:
             List[Dict[str, str]]: A list of dictionaries containing email details (subject, from, date).
         """
         self.logger.info(
-            f"Fetching emails with filters: count={count}, from_filter={from_filter}, subject_filter={subject_filter}, unread_only={unread_only}, date_from={date_from}, date_to={date_to}"
+            f"Fetching emails with filters: count={count}, from_filter={from_filter}, subject_filter={subject_filter}, unread_only={unread_only}, date_from={date_from}, date_to={date_to}, include_body={include_body}"
         )
 
         try:
@@ -166,24 +173,34 @@ class EmailService:
                     email_ids = messages[-count:]  # Limit to the last 'count' emails
                 else:
                     email_ids = messages
+                if include_body:
+                    # Bodies can be large, so a date range must not pull in the whole mailbox
+                    email_ids = email_ids[-self.MAX_LISTED_BODIES:]
+
+                # Fetch the details of all emails in a single round trip. BODY.PEEK leaves the
+                # \Seen flag alone and skips the headers that ENVELOPE already covers
+                fetch_items = ["ENVELOPE", "BODY.PEEK[TEXT]"] if include_body else ["ENVELOPE"]
+                message_data = mail.fetch(email_ids, fetch_items)
 
-                # Fetch the email details
                 emails = []
                 for email_id in reversed(email_ids):
-                    message_data = mail.fetch([email_id], ["ENVELOPE"])
                     envelope = message_data[email_id][b"ENVELOPE"]
                     email_subject = envelope.subject.decode("utf-8")
                     email_from = envelope.from_[0]
                     email_date = envelope.date.strftime("%Y-%m-%d %H:%M:%S")
 
-                    emails.append(
-                        {
-                            "email_id": str(email_id),
-                            "subject": email_subject,
-                            "from": str(email_from),
-                            "date": email_date,
-                        }
-                    )
+                    email_details = {
+                        "email_id": str(email_id),
+                        "subject": email_subject,
+                        "from": str(email_from),
+                        "date": email_date,
+                    }
+                    if include_body:
+                        # One message in another charset must not fail the whole listing
+                        email_details["body"] = message_data[email_id][b"BODY[TEXT]"].decode(
+                            "utf-8", errors="replace"
+                        )
+                    emails.append(email_details)
 
                 self.logger.info(f"Successfully fetched {len(emails)} emails.")
                 return emails
@@ -1,8 +1,14 @@
 import logging
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
 
 from src.connectors import SpotifyConnector
 
+# Largest page the saved-tracks and playlists endpoints return per request
+PAGE_SIZE = 50
+# Page requests of one call that may be in flight at once, to stay clear of rate limits
+MAX_PARALLEL_PAGES = 4
+
 
 class SpotifyService:
     """
@@ -178,7 +184,8 @@ class SpotifyService:
         Retrieves the user's liked songs.
 
         Args:
-            limit (int): The maximum number of tracks to return (default is 20).
+            limit (int): The maximum number of tracks to return (default is 20). Limits above
+                the API's page size of 50 are fetched as several concurrent page requests.
             offset (int): The index of the first track to return (useful for pagination).
 
         Returns:
@@ -191,21 +198,24 @@ class SpotifyService:
 
         try:
             self.spotify_connector.connect()
-            results = self.spotify_connector.client.current_user_saved_tracks(
-                limit=limit, offset=offset
+            client = self.spotify_connector.client
+
+            # The API returns at most PAGE_SIZE tracks per request. The first page tells how
+            # many liked songs exist, so only pages that can hold tracks are fetched after it,
+            # concurrently
+            first_page = client.current_user_saved_tracks(
+                limit=min(PAGE_SIZE, limit), offset=offset
+            )
+            end = min(offset + limit, first_page["total"])
+            pages = [first_page] + self._fetch_pages(
+                lambda page_offset: client.current_user_saved_tracks(
+                    limit=min(PAGE_SIZE, end - page_offset), offset=page_offset
+                ),
+                range(offset + PAGE_SIZE, end, PAGE_SIZE),
             )
 
             liked_songs = [
-                {
-                    "track_name": item["track"]["name"],
-                    "artist": ", ".join(
-                        artist["name"] for artist in item["track"]["artists"]
-                    ),
-                    "album": item["track"]["album"]["name"],
-                    "added_at": item["added_at"],
-                    "track_id": item["track"]["id"],
-                }
-                for item in results["items"]
+                self._liked_song(item) for page in pages for item in page["items"]
             ]
 
             self.logger.info(f"Retrieved {len(liked_songs)} liked songs")
@@ -215,9 +225,55 @@ class SpotifyService:
             self.logger.error("Failed to retrieve liked songs.", exc_info=True)
             raise ConnectionError(f"Could not fetch liked songs: {e}")
 
+    def iter_liked_songs(self, limit: int = 20, offset: int = 0) -> Iterator[List[Dict]]:
+        """
+        Lazily retrieves the user's liked songs one page at a time. Unlike get_liked_songs,
+        only a single page of tracks is held in memory, and the next page is only requested
+        once the caller asks for it.
+
+        Args:
+            limit (int): The maximum number of tracks to return (default is 20).
+            offset (int): The index of the first track to return (useful for pagination).
+
+        Yields:
+            List[Dict]: The liked songs of one page, in the format of get_liked_songs.
+
+        Raises:
+            ConnectionError: If there is a connection issue with the Spotify API.
+        """
+        self.logger.info("Streaming liked songs")
+
+        try:
+            self.spotify_connector.connect()
+            client = self.spotify_connector.client
+            end = offset + limit
+
+            for page_offset in range(offset, end, PAGE_SIZE):
+                page = client.current_user_saved_tracks(
+                    limit=min(PAGE_SIZE, end - page_offset), offset=page_offset
+                )
+                if not page["items"]:
+                    return
+                yield [self._liked_song(item) for item in page["items"]]
+
+        except Exception as e:
+            self.logger.error("Failed to retrieve liked songs.", exc_info=True)
+            raise ConnectionError(f"Could not fetch liked songs: {e}")
+
+    @staticmethod
+    def _liked_song(item: Dict[str, Any]) -> Dict[str, str]:
+        track = item["track"]
+        return {
+            "track_name": track["name"],
+            "artist": ", ".join(artist["name"] for artist in track["artists"]),
+            "album": track["album"]["name"],
+            "added_at": item["added_at"],
+            "track_id": track["id"],
+        }
+
     def get_user_playlists(self) -> List[Dict]:
         """
-        Retrieves the playlists of the authenticated user.
+        Retrieves all playlists of the authenticated user, across all result pages.
 
         Returns:
             List[Dict]: A list of dictionaries containing playlist details.
@@ -229,7 +285,18 @@ class SpotifyService:
 
         try:
             self.spotify_connector.connect()
-            playlists = self.spotify_connector.client.current_user_playlists()
+            client = self.spotify_connector.client
+
+            # The first page tells how many playlists exist; the remaining pages are fetched
+            # concurrently instead of following the 'next' links one after another
+            first_page = client.current_user_playlists(limit=PAGE_SIZE)
+            pages = [first_page] + self._fetch_pages(
+                lambda page_offset: client.current_user_playlists(
+                    limit=PAGE_SIZE, offset=page_offset
+                ),
+                range(PAGE_SIZE, first_page["total"], PAGE_SIZE),
+            )
+
             playlist_data = [
                 {
                     "name": playlist["name"],
@@ -237,7 +304,8 @@ class SpotifyService:
                     "id": playlist["id"],
                     "owner": playlist["owner"]["display_name"],
                 }
-                for playlist in playlists["items"]
+                for page in pages
+                for playlist in page["items"]
             ]
             self.logger.info("Successfully retrieved user playlists.")
             return playlist_data
@@ -584,6 +652,44 @@ class SpotifyService:
             self.logger.error("Failed to retrieve multiple albums.", exc_info=True)
             raise ConnectionError(f"Could not fetch album details: {e}")
 
+    def get_multiple_tracks(self, track_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetches details for multiple tracks by their IDs, including their audio features.
+        The Spotify API accepts up to 50 track IDs per request, so the IDs are fetched in
+        chunks of that size instead of one request per track.
+
+        Args:
+            track_ids (List[str]): A list of Spotify track IDs.
+
+        Returns:
+            List[Dict[str, Any]]: A list of dictionaries with details for each track.
+
+        Raises:
+            ConnectionError: If there is a connection issue with the Spotify API.
+        """
+        self.logger.info(f"Fetching details for multiple tracks: {track_ids}")
+
+        try:
+            self.spotify_connector.connect()
+            client = self.spotify_connector.client
+
+            tracks = []
+            for start in range(0, len(track_ids), 50):
+                chunk = track_ids[start:start + 50]
+                chunk_tracks = client.tracks(chunk)["tracks"]
+                audio_features = client.audio_features(chunk)
+                for track, features in zip(chunk_tracks, audio_features):
+                    if track is not None:
+                        track["audio_features"] = features
+                        tracks.append(track)
+
+            self.logger.info(f"Successfully retrieved details for {len(tracks)} tracks.")
+            return tracks
+
+        except Exception as e:
+            self.logger.error("Failed to retrieve multiple tracks.", exc_info=True)
+            raise ConnectionError(f"Could not fetch track details: {e}")
+
     def add_tracks_to_playlist(self, playlist_id: str, track_ids: List[str]) -> str:
         """
         Adds multiple tracks to a specified playlist.
@@ -675,3 +781,17 @@ class SpotifyService:
         except Exception as e:
             self.logger.error("Failed to create playlist or add tracks.", exc_info=True)
             raise ConnectionError(f"Could not create playlist '{name}': {e}")
+
+    @staticmethod
+    def _fetch_pages(
+        fetch_page: Callable[[int], Dict[str, Any]], offsets: Sequence[int]
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetches the result pages starting at the given offsets, at most MAX_PARALLEL_PAGES at a
+        time, and returns them in offset order. A single page is fetched without a thread pool.
+        """
+        if len(offsets) <= 1:
+            return [fetch_page(page_offset) for page_offset in offsets]
+
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_PAGES, len(offsets))) as pool:
+            return list(pool.map(fetch_page, offsets))
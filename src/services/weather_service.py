@@ -44,9 +44,7 @@ class WeatherService:
         self.logger.info(f"Fetching weather information for {city_name}")
 
         try:
-            self.weather_connector.connect()
-            mgr = self.weather_connector.client.weather_manager()
-            observation = mgr.weather_at_place(city_name)
+            observation = self.weather_connector.weather_at_place(city_name)
             weather = observation.weather
 
             weather_dict = {
@@ -106,11 +104,8 @@ class WeatherService:
         )
 
         try:
-            self.weather_connector.connect()
-            mgr = self.weather_connector.client.weather_manager()
-
             # Abrufen der 5-Tage-Vorhersage in 3-Stunden-Intervallen
-            forecast = mgr.forecast_at_place(city_name, "3h")
+            forecast = self.weather_connector.forecast_at_place(city_name, "3h")
             forecast_list = forecast.forecast.weathers
 
             # Filter forecast data to match the number of requested days (up to 5 days)
@@ -0,0 +1,40 @@
+"""Test helper that runs two calls so the second starts while the first is still running."""
+
+import threading
+
+
+class OverlappingCalls:
+    """
+    Runs two calls in threads. The first is held inside the dependency wrapped with hold()
+    until the second has had time to start, so coalescing of concurrent requests can be
+    observed deterministically.
+    """
+
+    def __init__(self):
+        self._started = threading.Event()
+        self._release = threading.Event()
+
+    def hold(self, fn):
+        """Wraps fn as a side_effect that blocks until the second call has started."""
+
+        def held(*args, **kwargs):
+            self._started.set()
+            self._release.wait(timeout=5)
+            return fn(*args, **kwargs)
+
+        return held
+
+    def run(self, first, second):
+        """Runs first, then second while first is held, and returns both results."""
+        results = []
+        first_thread = threading.Thread(target=lambda: results.append(first()))
+        first_thread.start()
+        self._started.wait(timeout=5)
+        second_thread = threading.Thread(target=lambda: results.append(second()))
+        second_thread.start()
+        # Give the second caller time to find (or not find) the in-flight entry
+        second_thread.join(timeout=0.2)
+        self._release.set()
+        first_thread.join()
+        second_thread.join()
+        return results
@@ -0,0 +1,47 @@
+import unittest
+
+import numpy as np
+
+from src.entities import AudioRingBuffer
+
+
+class TestAudioRingBuffer(unittest.TestCase):
+    def test_view_without_wrap_is_read_only_view_of_buffer(self):
+        ring = AudioRingBuffer(8)
+        ring.write(np.arange(3, dtype=np.int16))
+        ring.write(np.arange(3, 5, dtype=np.int16))
+
+        samples = ring.view()
+        self.assertEqual([0, 1, 2, 3, 4], samples.tolist())
+        self.assertIs(ring.buffer, samples.base)
+        self.assertFalse(samples.flags.writeable)
+
+    def test_overflow_keeps_most_recent_samples(self):
+        ring = AudioRingBuffer(5)
+        ring.write(np.arange(4, dtype=np.int16))
+        ring.write(np.arange(4, 7, dtype=np.int16))
+
+        self.assertEqual(5, len(ring))
+        self.assertEqual([2, 3, 4, 5, 6], ring.view().tolist())
+
+    def test_write_larger_than_capacity(self):
+        ring = AudioRingBuffer(3)
+        ring.write(np.arange(10, dtype=np.int16))
+        self.assertEqual([7, 8, 9], ring.view().tolist())
+
+    def test_release_empties_and_rewinds(self):
+        ring = AudioRingBuffer(4)
+        ring.write(np.arange(3, dtype=np.int16))
+        ring.release()
+        ring.write(np.array([9, 9, 9], dtype=np.int16))
+
+        self.assertEqual([9, 9, 9], ring.view().tolist())
+        self.assertIs(ring.buffer, ring.view().base)
+
+    def test_invalid_capacity(self):
+        with self.assertRaises(ValueError):
+            AudioRingBuffer(0)
+
+
+if __name__ == "__main__":
+    unittest.main()
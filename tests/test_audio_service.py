@@ -0,0 +1,39 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from src.services.audio_service import AudioService
+
+
+class TestAudioServicePlayback(unittest.TestCase):
+    def setUp(self):
+        self.service = AudioService(mock.Mock())
+
+    def tearDown(self):
+        self.service.close()
+
+    def test_cue_sounds_are_converted_to_the_playback_format(self):
+        # The default theme ships a 48 kHz stereo cue
+        sent = self.service._sound_cache["sent"]
+
+        self.assertEqual(np.int16, sent.dtype)
+        self.assertEqual(AudioService.PLAYBACK_CHANNELS, sent.shape[1])
+        self.assertEqual(25610 // 2, len(sent))
+
+    def test_cue_and_reply_share_one_output_stream(self):
+        with mock.patch("src.services.audio_service.sd.OutputStream") as output_stream:
+            output_stream.return_value.latency = 0.0
+
+            self.service.play_sound("sent")
+            self.service.audio_queue.put(np.zeros(480, dtype=np.int16))
+            self.service.audio_queue.put(np.array([], dtype=np.int16))
+            self.service.play_audio()
+            self.service.play_sound("standby")
+
+            output_stream.assert_called_once()
+            self.service.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+import asyncio
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from overlapping_calls import OverlappingCalls
+from src.executors.command_executor import CommandExecutor
+
+
+class TestCommandExecutor(unittest.TestCase):
+    def setUp(self):
+        self.executor = CommandExecutor(platform="linux")
+
+    def test_returns_stdout_of_successful_command(self):
+        result = self.executor.exec({"command": "echo hello && echo world"})
+        self.assertEqual("hello\nworld", result)
+
+    def test_reports_non_zero_exit_code_with_output_and_error(self):
+        result = self.executor.exec({"command": "echo out; echo err >&2; exit 3"})
+        self.assertEqual(
+            "Command returned non-zero exit code 3.\nOutput: out\nError: err", result
+        )
+
+    def test_missing_command(self):
+        self.assertEqual("No command provided.", self.executor.exec({}))
+
+    def test_output_keeps_tail_and_replaces_invalid_utf8(self):
+        with mock.patch.object(CommandExecutor, "MAX_OUTPUT_BYTES", 4):
+            result = self.executor.exec({"command": r"printf 'abcdef\xff'"})
+        self.assertEqual("def�", result)
+
+    def test_endless_output_is_capped_and_command_terminated(self):
+        executor = CommandExecutor(platform="linux", timeout=5, max_output_bytes=10)
+        expected = "y\ny\ny\ny\ny\n... [output truncated, command terminated]"
+
+        self.assertEqual(expected, executor.exec({"command": "yes"}))
+        self.assertEqual(expected, asyncio.run(executor.exec_async({"command": "yes"})))
+
+    def test_runaway_writer_returns_the_start_of_its_output(self):
+        result = self.executor.exec({"command": "seq 1 2000000"})
+
+        self.assertTrue(result.startswith("1\n2\n3\n"), result[:50])
+        self.assertTrue(result.endswith("\n... [output truncated, command terminated]"))
+        self.assertNotIn("exit code", result)
+        self.assertLessEqual(len(result), CommandExecutor.MAX_OUTPUT_BYTES + 64)
+
+    def test_macos_adds_backup_suffix_to_sed_in_place(self):
+        command = {"command": 'echo "sed -i s/a/b/ file"'}
+        self.assertEqual(
+            "sed -i '' s/a/b/ file", CommandExecutor(platform="mac-os").exec(command)
+        )
+        self.assertEqual("sed -i s/a/b/ file", self.executor.exec(command))
+
+    def test_runaway_command_is_terminated_after_timeout(self):
+        executor = CommandExecutor(platform="linux", timeout=0.2)
+        self.assertEqual(
+            "Command timed out after 0.2 seconds and was terminated.",
+            executor.exec({"command": "sleep 5 & sleep 5"}),
+        )
+
+    def test_concurrent_exec_calls_are_bounded_by_max_parallel(self):
+        executor = CommandExecutor(platform="linux", max_parallel=1)
+        marker = tempfile.mktemp()
+        # Each command fails if another one is running at the same time
+        command = f"set -o noclobber; : > {marker} || exit 1; sleep 0.1; rm -f {marker}"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(executor.exec({"command": command})))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(["Command executed successfully."] * 3, results)
+
+    def test_exec_async_matches_exec(self):
+        async def run_all():
+            return await asyncio.gather(
+                self.executor.exec_async({"command": "echo hello"}),
+                self.executor.exec_async({"command": "echo err >&2; exit 1"}),
+                self.executor.exec_async({}),
+            )
+
+        self.assertEqual(
+            [
+                "hello",
+                "Command returned non-zero exit code 1.\nOutput: \nError: err",
+                "No command provided.",
+            ],
+            asyncio.run(run_all()),
+        )
+
+    def _run_concurrently(self, command, calls):
+        def run(cmd):
+            calls.append(cmd)
+            return f"ran {cmd}"
+
+        overlap = OverlappingCalls()
+        with mock.patch.object(CommandExecutor, "_run_command", side_effect=overlap.hold(run)):
+            return overlap.run(
+                lambda: self.executor.exec({"command": command}),
+                lambda: self.executor.exec({"command": command}),
+            )
+
+    def test_identical_read_only_commands_share_one_run(self):
+        calls = []
+        results = self._run_concurrently("df -h", calls)
+        self.assertEqual(["df -h"], calls)
+        self.assertEqual(["ran df -h", "ran df -h"], results)
+        self.assertEqual(0, len(self.executor._inflight))
+
+    def test_commands_with_side_effects_are_not_coalesced(self):
+        calls = []
+        self._run_concurrently("cat a > b", calls)
+        self.assertEqual(["cat a > b", "cat a > b"], calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
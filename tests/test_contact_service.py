@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+
+from src.executors import ContactExecutor
+from src.services.contact_service import ContactService
+
+VCARDS = """BEGIN:VCARD
+VERSION:3.0
+FN:Alice Smith
+EMAIL:alice@example.com
+TEL:+49 30 123456
+END:VCARD
+BEGIN:VCARD
+VERSION:3.0
+FN:Bob Jones
+EMAIL:bob@Example.org
+EMAIL:bob@work.de
+END:VCARD
+"""
+
+
+class TestContactService(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".vcf")
+        with os.fdopen(handle, "w") as f:
+            f.write(VCARDS)
+        self.service = ContactService(self.path)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_list_returns_all_contacts(self):
+        contacts = self.service.list()
+        self.assertEqual(["Alice Smith", "Bob Jones"], [c["name"] for c in contacts])
+        self.assertEqual(["+49 30 123456"], contacts[0]["phones"])
+        self.assertEqual("bob@Example.org, bob@work.de", contacts[1]["emails_str"])
+        self.assertEqual("", contacts[1]["phones_str"])
+
+    def test_search_matches_names_and_emails_case_insensitively(self):
+        self.assertEqual(["Bob Jones"], [c["name"] for c in self.service.list("EXAMPLE.ORG")])
+        self.assertEqual(["Alice Smith"], [c["name"] for c in self.service.list("alice")])
+
+    def test_short_and_unknown_search_strings(self):
+        self.assertEqual(["Alice Smith", "Bob Jones"], [c["name"] for c in self.service.list("s")])
+        self.assertEqual([], self.service.list("zz"))
+
+    def test_missing_file_yields_no_contacts(self):
+        self.assertEqual([], ContactService(self.path + ".missing").list())
+
+    def test_file_is_parsed_again_only_after_it_changed(self):
+        self.assertEqual(2, len(self.service.list()))
+        first_parse = self.service._contacts
+
+        self.service.list("alice")
+        self.assertIs(first_parse, self.service._contacts)
+
+        with open(self.path, "a") as f:
+            f.write("BEGIN:VCARD\nVERSION:3.0\nFN:Carol White\nEND:VCARD\n")
+        self.assertEqual(["Carol White"], [c["name"] for c in self.service.list("carol")])
+
+    def test_executor_formats_search_results(self):
+        executor = ContactExecutor(self.service)
+        self.assertEqual(
+            "Name: Bob Jones, Emails: bob@Example.org, bob@work.de, Phones: ",
+            executor.exec({"operation": "search", "search_string": "bob"}),
+        )
+        self.assertEqual(
+            "No contacts found.",
+            executor.exec({"operation": "search", "search_string": "nobody"}),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
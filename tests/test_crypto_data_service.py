@@ -0,0 +1,59 @@
+import unittest
+from unittest import mock
+
+from overlapping_calls import OverlappingCalls
+from src.services.crypto_data_service import CryptoDataService
+
+OHLC = [[1700000000000, 1.0, 2.0, 0.5, 1.5]]
+
+
+class TestCryptoDataServiceCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.connector = mock.Mock()
+        self.service = CryptoDataService(self.connector)
+
+    def _fetch_concurrently(self, first_args, second_args):
+        calls = []
+
+        def ohlc(**kwargs):
+            calls.append(kwargs)
+            return OHLC
+
+        overlap = OverlappingCalls()
+        self.connector.client.get_coin_ohlc_by_id.side_effect = overlap.hold(ohlc)
+        results = overlap.run(
+            lambda: self.service.get_ohlc(*first_args),
+            lambda: self.service.get_ohlc(*second_args),
+        )
+        return calls, results
+
+    def test_identical_concurrent_requests_share_one_call(self):
+        calls, results = self._fetch_concurrently(("bitcoin", "usd", 7), ("bitcoin", "usd", 7))
+
+        self.assertEqual([{"id": "bitcoin", "vs_currency": "usd", "days": 7}], calls)
+        self.assertEqual([OHLC, OHLC], results)
+        self.assertEqual(0, len(self.service._inflight))
+
+    def test_different_requests_are_not_coalesced(self):
+        calls, _ = self._fetch_concurrently(("bitcoin", "usd", 7), ("bitcoin", "eur", 7))
+
+        self.assertEqual(2, len(calls))
+
+    def test_errors_are_not_cached(self):
+        self.connector.client.get_coin_by_id.side_effect = [RuntimeError("boom"), {
+            "market_data": {
+                "current_price": {"usd": 1},
+                "market_cap": {"usd": 2},
+                "total_volume": {"usd": 3},
+            }
+        }]
+
+        self.assertEqual({}, self.service.get_market_data("bitcoin"))
+        self.assertEqual(
+            {"current_price": 1, "market_cap": 2, "volume_24h": 3},
+            self.service.get_market_data("bitcoin"),
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
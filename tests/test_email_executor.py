@@ -0,0 +1,76 @@
+import asyncio
+import itertools
+import threading
+import unittest
+from unittest import mock
+
+from src.executors.email_executor import EmailExecutor
+
+
+class TestEmailExecutor(unittest.TestCase):
+    def setUp(self):
+        self.service = mock.Mock()
+        self.executor = EmailExecutor(self.service, "Rachel")
+
+    def test_list_formats_rows(self):
+        self.service.list.return_value = [
+            {"email_id": "7", "from": "a@example.com", "subject": "Hi", "date": "2024-01-05"},
+        ]
+        self.assertEqual(
+            "ID: 7, From: a@example.com, Subject: Hi, Date: 2024-01-05",
+            self.executor.exec({"operation": "list", "count": 1}),
+        )
+
+    def test_list_with_bodies_fetches_them_in_the_same_call(self):
+        self.service.list.return_value = [
+            {"email_id": "7", "from": "a@x.de", "subject": "Hi", "date": "d1", "body": "One"},
+            {"email_id": "8", "from": "b@x.de", "subject": "Yo", "date": "d2", "body": "Two"},
+        ]
+        result = self.executor.exec({"operation": "list", "count": 2, "include_body": True})
+
+        self.assertEqual(
+            "ID: 7, From: a@x.de, Subject: Hi, Date: d1\nBody:\nOne\n\n"
+            "ID: 8, From: b@x.de, Subject: Yo, Date: d2\nBody:\nTwo",
+            result,
+        )
+        self.assertTrue(self.service.list.call_args.kwargs["include_body"])
+        self.service.get.assert_not_called()
+
+    def test_iter_email_rows_formats_lazily(self):
+        emails = [
+            {"email_id": str(i), "from": "a@x.de", "subject": "Hi", "date": "d"} for i in range(3)
+        ]
+        self.service.list.return_value = emails
+
+        rows = self.executor.iter_email_rows({"operation": "list", "count": 3})
+        self.assertEqual(
+            ["ID: 0, From: a@x.de, Subject: Hi, Date: d"], list(itertools.islice(rows, 1))
+        )
+        # Rows are only built on demand, so a row that was never reached can still change
+        emails[2]["subject"] = "Changed"
+        self.assertEqual("ID: 2, From: a@x.de, Subject: Changed, Date: d", list(rows)[-1])
+
+    def test_invalid_operation(self):
+        self.assertEqual("Invalid operation: move", self.executor.exec({"operation": "move"}))
+
+    def test_exec_async_overlaps_concurrent_calls(self):
+        # Both calls must be inside the service at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get(email_id):
+            barrier.wait()
+            return f"Body of {email_id}"
+
+        self.service.get.side_effect = get
+
+        async def run_both():
+            return await asyncio.gather(
+                self.executor.exec_async({"operation": "get", "email_id": ["1"]}),
+                self.executor.exec_async({"operation": "get", "email_id": ["2"]}),
+            )
+
+        self.assertEqual(["Body of 1", "Body of 2"], asyncio.run(run_both()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from src.services.email_service import EmailService
+
+
+def _envelope(subject):
+    return mock.Mock(subject=subject.encode(), from_=["a@example.com"], date=datetime(2024, 1, 5))
+
+
+class TestEmailServiceList(unittest.TestCase):
+    def setUp(self):
+        self.imap = mock.MagicMock()
+        self.mail = self.imap.connect.return_value.__enter__.return_value
+        self.service = EmailService(mock.Mock(), self.imap)
+
+    def test_bodies_are_peeked_capped_and_decoded_leniently(self):
+        message_ids = list(range(1, 31))
+        self.mail.search.return_value = message_ids
+        self.mail.fetch.side_effect = lambda ids, items: {
+            i: {b"ENVELOPE": _envelope(f"S{i}"), b"BODY[TEXT]": "Grüße".encode("latin-1")}
+            for i in ids
+        }
+
+        emails = self.service.list(date_from=datetime(2024, 1, 1), include_body=True)
+
+        fetched_ids, items = self.mail.fetch.call_args.args
+        self.assertEqual(message_ids[-EmailService.MAX_LISTED_BODIES:], fetched_ids)
+        self.assertEqual(["ENVELOPE", "BODY.PEEK[TEXT]"], items)
+        self.assertEqual("Gr\ufffd\ufffde", emails[0]["body"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from unittest import mock
+
+from src.connectors.weather.open_weather_map_connector import OpenWeatherMapConnector
+
+
+class TestOpenWeatherMapConnectorCache(unittest.TestCase):
+    def setUp(self):
+        self.connector = OpenWeatherMapConnector("test-key")
+        self.manager = mock.Mock()
+        self.connector._weather_manager = self.manager
+        self.connector.client = object()
+
+    def tearDown(self):
+        self.connector.close()
+
+    def test_repeated_lookup_is_served_from_cache(self):
+        first = self.connector.weather_at_place("Berlin")
+        second = self.connector.weather_at_place(" berlin ")
+
+        self.assertIs(first, second)
+        self.manager.weather_at_place.assert_called_once_with("Berlin")
+
+    def test_expired_entry_is_fetched_again(self):
+        with mock.patch(
+            "src.entities.ttl_cache.time.monotonic",
+            side_effect=[0.0, OpenWeatherMapConnector.CACHE_TTL_SECONDS + 1.0],
+        ):
+            self.connector.forecast_at_place("Berlin")
+            self.connector.forecast_at_place("Berlin")
+
+        self.assertEqual(2, self.manager.forecast_at_place.call_count)
+
+    def test_failed_lookup_is_not_cached(self):
+        self.manager.weather_at_place.side_effect = [RuntimeError("down"), "observation"]
+
+        with self.assertRaises(RuntimeError):
+            self.connector.weather_at_place("Berlin")
+        self.assertEqual("observation", self.connector.weather_at_place("Berlin"))
+
+
+class TestOpenWeatherMapConnectorClient(unittest.TestCase):
+    def test_connectors_share_one_client_per_api_key(self):
+        with mock.patch.dict(
+            "src.connectors.weather.open_weather_map_connector._CLIENTS", clear=True
+        ), mock.patch(
+            "src.connectors.weather.open_weather_map_connector.pyowm.OWM",
+            side_effect=lambda api_key: mock.Mock(api_key=api_key),
+        ) as owm:
+            connectors = [OpenWeatherMapConnector(key) for key in ("a", "a", "b")]
+            for connector in connectors:
+                connector.connect()
+                connector.close()
+
+        self.assertIs(connectors[0].client, connectors[1].client)
+        self.assertIsNot(connectors[0].client, connectors[2].client)
+        self.assertEqual(2, owm.call_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
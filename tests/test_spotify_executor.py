@@ -0,0 +1,140 @@
+import asyncio
+import json
+import threading
+import unittest
+from unittest import mock
+
+from src.executors.spotify_executor import SpotifyExecutor
+
+
+class TestSpotifyExecutor(unittest.TestCase):
+    def setUp(self):
+        self.service = mock.Mock()
+        self.executor = SpotifyExecutor(self.service)
+
+    def test_dispatches_operation_without_parameters(self):
+        self.service.get_available_devices.return_value = [{"id": "d1"}]
+        result = self.executor.exec({"operation": "get_available_devices"})
+        self.assertEqual([{"id": "d1"}], json.loads(result))
+
+    def test_dispatches_operation_with_parameters(self):
+        self.service.play_track.return_value = "Playing"
+        result = self.executor.exec({"operation": "play_track", "track_id": "t1"})
+        self.assertEqual("Playing", result)
+        self.service.play_track.assert_called_once_with("t1", device_id=None)
+
+    def test_get_multiple_tracks_uses_one_service_call(self):
+        self.service.get_multiple_tracks.return_value = [{"id": "t1"}, {"id": "t2"}]
+        result = self.executor.exec(
+            {"operation": "get_multiple_tracks", "track_ids": ["t1", "t2"]}
+        )
+        self.assertEqual([{"id": "t1"}, {"id": "t2"}], json.loads(result))
+        self.service.get_multiple_tracks.assert_called_once_with(["t1", "t2"])
+
+    def test_iter_liked_songs_yields_one_json_array_per_page(self):
+        songs = [[{"track_id": "t1"}], [{"track_id": "t2"}]]
+        self.service.iter_liked_songs.return_value = iter(songs)
+        pages = list(self.executor.iter_liked_songs({"limit": 2, "offset": 5}))
+
+        self.assertEqual(songs, [json.loads(page) for page in pages])
+        self.service.iter_liked_songs.assert_called_once_with(limit=2, offset=5)
+
+    def test_missing_required_parameter(self):
+        self.assertEqual(
+            "Missing required parameter 'track_id' for 'play_track' operation.",
+            self.executor.exec({"operation": "play_track"}),
+        )
+        self.service.play_track.assert_not_called()
+
+    def test_blank_track_ids_are_dropped_before_calling_spotify(self):
+        self.assertEqual(
+            "Missing required parameter 'track_ids' for 'add_tracks_to_queue' operation.",
+            self.executor.exec({"operation": "add_tracks_to_queue", "track_ids": ["", "  "]}),
+        )
+        self.service.add_tracks_to_queue.assert_not_called()
+
+        self.executor.exec({"operation": "add_tracks_to_queue", "track_ids": ["t1", " "]})
+        self.service.add_tracks_to_queue.assert_called_once_with(["t1"], device_id=None)
+
+    def test_zero_volume_is_not_treated_as_missing(self):
+        self.service.set_volume.return_value = "Muted"
+        result = self.executor.exec({"operation": "set_volume", "volume_percent": 0})
+        self.assertEqual("Muted", result)
+
+    def test_every_missing_parameter_is_reported(self):
+        self.assertEqual(
+            "Missing required parameter 'track_ids' for 'add_tracks_to_playlist' operation.",
+            self.executor.exec(
+                {"operation": "add_tracks_to_playlist", "playlist_id": "p1", "track_ids": []}
+            ),
+        )
+
+    def test_exec_batch_runs_operations_concurrently(self):
+        # Both calls must be inside the service at the same time to pass the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def pause_playback(device_id=None):
+            barrier.wait()
+            return "Paused"
+
+        def get_available_devices():
+            barrier.wait()
+            return [{"id": "d1"}]
+
+        self.service.pause_playback.side_effect = pause_playback
+        self.service.get_available_devices.side_effect = get_available_devices
+
+        results = asyncio.run(
+            self.executor.exec_batch(
+                [{"operation": "pause_playback"}, {"operation": "get_available_devices"}]
+            )
+        )
+        self.assertEqual(["Paused", '[{"id":"d1"}]'], results)
+
+    def test_service_errors_are_returned_as_text(self):
+        self.service.get_track_details.side_effect = ConnectionError("offline")
+        self.assertEqual(
+            "Error performing operation 'get_track_details': offline",
+            self.executor.exec({"operation": "get_track_details", "track_id": "t1"}),
+        )
+
+    def test_track_details_are_served_from_cache(self):
+        self.service.get_track_details.return_value = {"id": "t1"}
+        first = self.executor.exec({"operation": "get_track_details", "track_id": "t1"})
+        second = self.executor.exec({"operation": "get_track_details", "track_id": "t1"})
+
+        self.assertEqual(first, second)
+        self.service.get_track_details.assert_called_once_with("t1")
+
+    def test_playlist_changes_invalidate_cached_playlists(self):
+        self.service.get_user_playlists.side_effect = [[{"id": "p1"}], [{"id": "p1"}, {"id": "p2"}]]
+        self.executor.exec({"operation": "get_user_playlists"})
+        self.executor.exec({"operation": "create_playlist", "playlist_name": "New"})
+
+        result = self.executor.exec({"operation": "get_user_playlists"})
+        self.assertEqual([{"id": "p1"}, {"id": "p2"}], json.loads(result))
+
+    def test_expired_entries_are_fetched_again(self):
+        self.service.get_user_playlists.return_value = [{"id": "p1"}]
+        with mock.patch("src.entities.ttl_cache.time.monotonic", side_effect=[0, 61]):
+            self.executor.exec({"operation": "get_user_playlists"})
+            self.executor.exec({"operation": "get_user_playlists"})
+        self.assertEqual(2, self.service.get_user_playlists.call_count)
+
+    def test_device_state_is_not_stale_after_playback_changes(self):
+        self.service.get_available_devices.side_effect = [
+            [{"id": "d1", "is_active": False}],
+            [{"id": "d1", "is_active": True}],
+        ]
+        self.executor.exec({"operation": "get_available_devices"})
+        self.executor.exec({"operation": "play_track", "track_id": "t1", "device_id": "d1"})
+
+        result = self.executor.exec({"operation": "get_available_devices"})
+        self.assertEqual([{"id": "d1", "is_active": True}], json.loads(result))
+
+    def test_invalid_operation(self):
+        self.assertEqual("Invalid operation: rewind", self.executor.exec({"operation": "rewind"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from unittest import mock
+
+from src.services.spotify_service import PAGE_SIZE, SpotifyService
+
+
+def _saved_track(number):
+    return {
+        "track": {
+            "name": f"Track {number}",
+            "artists": [{"name": "Artist"}],
+            "album": {"name": "Album"},
+            "id": f"t{number}",
+        },
+        "added_at": "2024-01-01T00:00:00Z",
+    }
+
+
+def _playlist(number):
+    return {
+        "name": f"Playlist {number}",
+        "tracks": {"total": 1},
+        "id": f"p{number}",
+        "owner": {"display_name": "Me"},
+    }
+
+
+class TestSpotifyServicePagination(unittest.TestCase):
+    def setUp(self):
+        self.connector = mock.Mock()
+        self.client = self.connector.client
+        self.service = SpotifyService(self.connector)
+
+    @staticmethod
+    def _saved_tracks(total):
+        return lambda limit, offset: {
+            "items": [_saved_track(n) for n in range(offset, min(offset + limit, total))],
+            "total": total,
+        }
+
+    def test_large_liked_songs_limit_is_split_into_pages(self):
+        self.client.current_user_saved_tracks.side_effect = self._saved_tracks(total=500)
+
+        songs = self.service.get_liked_songs(limit=120, offset=10)
+
+        self.assertEqual(
+            [f"t{number}" for number in range(10, 130)], [song["track_id"] for song in songs]
+        )
+        self.assertCountEqual(
+            [
+                mock.call(limit=50, offset=10),
+                mock.call(limit=50, offset=60),
+                mock.call(limit=20, offset=110),
+            ],
+            self.client.current_user_saved_tracks.call_args_list,
+        )
+
+    def test_liked_songs_limit_beyond_the_library_sends_no_extra_requests(self):
+        self.client.current_user_saved_tracks.side_effect = self._saved_tracks(total=60)
+
+        songs = self.service.get_liked_songs(limit=1000)
+
+        self.assertEqual([f"t{number}" for number in range(60)], [s["track_id"] for s in songs])
+        self.assertCountEqual(
+            [mock.call(limit=50, offset=0), mock.call(limit=10, offset=50)],
+            self.client.current_user_saved_tracks.call_args_list,
+        )
+
+    def test_iter_liked_songs_requests_pages_on_demand(self):
+        self.client.current_user_saved_tracks.side_effect = self._saved_tracks(total=500)
+
+        pages = self.service.iter_liked_songs(limit=120)
+        first_page = next(pages)
+
+        self.assertEqual(PAGE_SIZE, len(first_page))
+        self.assertEqual(1, self.client.current_user_saved_tracks.call_count)
+        self.assertEqual([20], [len(page) for page in pages][1:])
+
+    def test_all_playlist_pages_are_returned_in_order(self):
+        total = 2 * PAGE_SIZE + 5
+        self.client.current_user_playlists.side_effect = lambda limit, offset=0: {
+            "items": [_playlist(n) for n in range(offset, min(offset + limit, total))],
+            "total": total,
+        }
+
+        playlists = self.service.get_user_playlists()
+
+        self.assertEqual([f"p{number}" for number in range(total)], [p["id"] for p in playlists])
+        self.assertEqual(3, self.client.current_user_playlists.call_count)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import threading
+import unittest
+
+from src.connectors.openai.stream_splitter import StreamSplitter
+
+
+class TestStreamSplitter(unittest.TestCase):
+    def test_consumers_receive_all_chunks_in_order(self):
+        release = threading.Event()
+
+        def source():
+            yield "a"
+            release.wait(timeout=5)
+            yield "b"
+            yield "c"
+
+        splitter = StreamSplitter(source())
+        splitter.start()
+
+        first = splitter.get()
+        self.assertEqual("a", next(first))
+        release.set()
+        self.assertEqual(["b", "c"], list(first))
+
+        # A consumer that starts late still sees the whole stream
+        self.assertEqual(["a", "b", "c"], list(splitter.get()))
+
+    def test_empty_stream_finishes_consumers(self):
+        splitter = StreamSplitter(iter(()))
+        splitter.start()
+        self.assertEqual([], list(splitter.get()))
+
+    def test_closed_consumer_is_unregistered(self):
+        release = threading.Event()
+
+        def source():
+            yield "a"
+            release.wait(timeout=5)
+            yield "b"
+
+        splitter = StreamSplitter(source())
+        splitter.start()
+
+        consumer = splitter.get()
+        self.assertEqual("a", next(consumer))
+        consumer.close()
+        self.assertEqual([], splitter._consumers)
+
+        release.set()
+        self.assertEqual(["a", "b"], list(splitter.get()))
+
+
+if __name__ == "__main__":
+    unittest.main()
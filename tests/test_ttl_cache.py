@@ -0,0 +1,34 @@
+import unittest
+from unittest import mock
+
+from src.entities import TTLCache
+
+
+class TestTTLCache(unittest.TestCase):
+    def test_entry_ttl_overrides_the_default(self):
+        cache = TTLCache(ttl_seconds=10, max_entries=8)
+        fetch = mock.Mock(side_effect=["first", "second"])
+
+        with mock.patch("src.entities.ttl_cache.time.monotonic", side_effect=[0.0, 50.0]):
+            cache.get_or_fetch("key", fetch, ttl_seconds=100)
+            self.assertEqual("first", cache.get_or_fetch("key", fetch))
+        fetch.assert_called_once_with()
+
+    def test_oldest_entry_is_evicted_when_full(self):
+        cache = TTLCache(ttl_seconds=10, max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.get_or_fetch(key, lambda: key)
+
+        self.assertEqual(2, len(cache))
+        self.assertEqual("new", cache.get_or_fetch("a", lambda: "new"))
+
+    def test_popped_entry_is_fetched_again(self):
+        cache = TTLCache(ttl_seconds=10, max_entries=8)
+        cache.get_or_fetch("key", lambda: "old")
+        cache.pop("key")
+
+        self.assertEqual("new", cache.get_or_fetch("key", lambda: "new"))
+
+
+if __name__ == "__main__":
+    unittest.main()